@@ -2,6 +2,8 @@
 package main
 
 import (
+	"bufio"
+	"bytes"
 	"crypto/ecdsa"
 	"encoding/json"
 	"fmt"
@@ -23,6 +25,7 @@ var (
 	schemaFile   string
 	batchDir     string
 	stdinInput   bool
+	serverMode   bool
 	outputFile   string
 	outputDir    string
 	developer    string
@@ -58,11 +61,16 @@ func main() {
 		Long: `Sign JSON schema files using ECDSA private keys for SchemaPin verification.
 
 This tool signs individual schemas, processes batches of schema files, or reads
-from stdin to create signed schemas with cryptographic signatures.`,
+from stdin to create signed schemas with cryptographic signatures.
+
+In --server mode it reads one JSON schema per line from stdin and writes one
+signed schema per line to stdout until stdin is closed, so callers signing many
+schemas pay process startup and key loading only once.`,
 		Example: `  schemapin-sign --key private.pem --schema schema.json --output signed_schema.json
 		schemapin-sign --key private.pem --schema schema.json --developer "Alice Corp" --schema-version "1.0"
 		schemapin-sign --key private.pem --batch schemas/ --output-dir signed/
-		echo '{"type": "object"}' | schemapin-sign --key private.pem --stdin`,
+		echo '{"type": "object"}' | schemapin-sign --key private.pem --stdin
+		schemapin-sign --key private.pem --server`,
 		RunE: runSign,
 	}
 
@@ -70,8 +78,9 @@ from stdin to create signed schemas with cryptographic signatures.`,
 	rootCmd.Flags().StringVar(&schemaFile, "schema", "", "Input schema file")
 	rootCmd.Flags().StringVar(&batchDir, "batch", "", "Directory containing schema files to sign")
 	rootCmd.Flags().BoolVar(&stdinInput, "stdin", false, "Read schema from stdin")
-	rootCmd.MarkFlagsOneRequired("schema", "batch", "stdin")
-	rootCmd.MarkFlagsMutuallyExclusive("schema", "batch", "stdin")
+	rootCmd.Flags().BoolVar(&serverMode, "server", false, "Sign newline-delimited JSON schemas from stdin until EOF")
+	rootCmd.MarkFlagsOneRequired("schema", "batch", "stdin", "server")
+	rootCmd.MarkFlagsMutuallyExclusive("schema", "batch", "stdin", "server")
 
 	// Key options
 	rootCmd.Flags().StringVar(&keyFile, "key", "", "Private key file (PEM format)")
@@ -151,6 +160,10 @@ func runSign(cmd *cobra.Command, args []string) error {
 		metadata[k] = v
 	}
 
+	if serverMode {
+		return runServer(privateKey, metadata)
+	}
+
 	var results []ProcessResult
 
 	if stdinInput {
@@ -250,6 +263,55 @@ func processStdin(privateKey *ecdsa.PrivateKey, metadata map[string]interface{})
 	}, nil
 }
 
+// runServer signs one JSON schema per stdin line and writes one JSON response
+// per stdout line: the signed schema on success, or a ProcessResult with
+// status "error". Per-request failures do not stop the server.
+func runServer(privateKey *ecdsa.PrivateKey, metadata map[string]interface{}) error {
+	scanner := bufio.NewScanner(os.Stdin)
+	scanner.Buffer(make([]byte, 0, 64*1024), 16*1024*1024)
+	writer := bufio.NewWriter(os.Stdout)
+	encoder := json.NewEncoder(writer)
+
+	for scanner.Scan() {
+		line := bytes.TrimSpace(scanner.Bytes())
+		if len(line) == 0 {
+			continue
+		}
+
+		var response interface{}
+		var schema map[string]interface{}
+		if err := json.Unmarshal(line, &schema); err != nil {
+			response = serverError(fmt.Sprintf("failed to parse JSON: %v", err))
+		} else if !noValidate && !validateSchemaFormat(schema) {
+			response = serverError("schema format validation failed")
+		} else if signedSchema, err := signSchema(schema, privateKey, metadata); err != nil {
+			response = serverError(err.Error())
+		} else {
+			response = signedSchema
+		}
+
+		if err := encoder.Encode(response); err != nil {
+			return fmt.Errorf("failed to write response: %w", err)
+		}
+		if err := writer.Flush(); err != nil {
+			return fmt.Errorf("failed to write response: %w", err)
+		}
+	}
+
+	if err := scanner.Err(); err != nil {
+		return fmt.Errorf("failed to read from stdin: %w", err)
+	}
+	return nil
+}
+
+func serverError(message string) ProcessResult {
+	return ProcessResult{
+		Input:  "stdin",
+		Status: "error",
+		Error:  message,
+	}
+}
+
 func processSingleSchema(schemaPath string, privateKey *ecdsa.PrivateKey, outputPath string, metadata map[string]interface{}) (ProcessResult, error) {
 	schema, err := loadSchema(schemaPath)
 	if err != nil {
@@ -0,0 +1,75 @@
+// Persistent JavaScript worker for the Python integration demo scripts.
+//
+// Imports every SchemaPin module once, then answers newline-delimited JSON
+// requests of the form {"op": ..., "args": {...}} on stdin with
+// {"ok": true, "result": ...} or {"ok": false, "error": ...} on stdout,
+// one line per request.
+
+import { createHash } from 'crypto';
+import { createInterface } from 'readline';
+import { readFileSync } from 'fs';
+import { SchemaPinCore } from '../../javascript/src/core.js';
+import { KeyManager } from '../../javascript/src/crypto.js';
+import {
+    SchemaSigningWorkflow,
+    SchemaVerificationWorkflow,
+    createWellKnownResponse
+} from '../../javascript/src/utils.js';
+
+// stdout carries the protocol; keep stray library logging off it
+console.log = console.error;
+
+const handlers = {
+    canonicalize: ({ schema }) => SchemaPinCore.canonicalizeSchema(schema),
+
+    canonical_digests: ({ schemas }) =>
+        schemas.map(schema =>
+            createHash('sha256').update(SchemaPinCore.canonicalizeSchema(schema)).digest('hex')
+        ),
+
+    fingerprint: ({ publicKeyPath }) => {
+        const publicKey = KeyManager.loadPublicKeyPem(readFileSync(publicKeyPath, 'utf8'));
+        return KeyManager.calculateKeyFingerprint(publicKey);
+    },
+
+    well_known: ({ publicKeyPath, developerName, contact, revokedKeys, schemaVersion }) =>
+        createWellKnownResponse(
+            readFileSync(publicKeyPath, 'utf8'),
+            developerName,
+            contact,
+            revokedKeys,
+            schemaVersion
+        ),
+
+    sign: ({ schema, privateKeyPath }) =>
+        new SchemaSigningWorkflow(readFileSync(privateKeyPath, 'utf8')).signSchema(schema),
+
+    sign_benchmark: ({ schema, privateKeyPath, iterations }) => {
+        const workflow = new SchemaSigningWorkflow(readFileSync(privateKeyPath, 'utf8'));
+        const startTime = Date.now();
+        for (let i = 0; i < iterations; i++) {
+            workflow.signSchema(schema);
+        }
+        return (Date.now() - startTime) / 1000;
+    },
+
+    verify: async ({ schema, signature, publicKeyPath, toolId, domain }) => {
+        const publicKeyPem = readFileSync(publicKeyPath, 'utf8');
+        const workflow = new SchemaVerificationWorkflow();
+        workflow.discovery.getPublicKeyPem = async () => publicKeyPem;
+        workflow.discovery.getDeveloperInfo = async () => null;
+        workflow.discovery.validateKeyNotRevoked = async () => true;
+        return workflow.verifySchema(schema, signature, toolId, domain, true);
+    }
+};
+
+for await (const line of createInterface({ input: process.stdin })) {
+    let response;
+    try {
+        const { op, args } = JSON.parse(line);
+        response = { ok: true, result: await handlers[op](args) };
+    } catch (error) {
+        response = { ok: false, error: String(error && error.stack || error) };
+    }
+    process.stdout.write(JSON.stringify(response) + '\n');
+}
@@ -0,0 +1,177 @@
+"""Shared HTTP session and response cache for discovery and revocation fetches.
+
+``requests`` is only imported when the first session is created, so offline
+verification (local files, trust bundles) never pays for importing it.
+"""
+
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Optional, Tuple
+
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+except ImportError:  # Optional: install schemapin[fast] for faster response parsing
+    orjson = None
+
+# Lifetime of a cached document when the server sends no freshness headers
+DEFAULT_TTL = 300.0
+# Lifetime of a cached failure, so broken endpoints are not hammered
+NEGATIVE_TTL = 10.0
+
+_session: Optional["requests.Session"] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> "requests.Session":
+    """Return the process-wide pooled session, creating it on first use.
+
+    Reusing one session keeps connections (and their TLS sessions) alive
+    across fetches to the same host, instead of a new handshake per call.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+
+                _session = requests.Session()
+    return _session
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a per-entry TTL."""
+
+    def __init__(self, maxsize: int = 256):
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return ``(True, value)`` for a fresh entry, else ``(False, None)``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store ``value`` for ``ttl`` seconds; a non-positive TTL drops the key."""
+        with self._lock:
+            if ttl <= 0:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Parsed discovery / revocation bodies keyed by URL
+response_cache = TTLCache()
+# (ETag, Last-Modified, parsed body) keyed by URL. Outlives the freshness
+# TTL so expired entries can be revalidated with a conditional GET.
+validator_cache = TTLCache()
+
+
+def response_ttl(response: "requests.Response", default: float = DEFAULT_TTL) -> float:
+    """Freshness lifetime of a response from Cache-Control / Expires headers."""
+    cache_control = response.headers.get("Cache-Control", "")
+    for directive in cache_control.lower().split(","):
+        directive = directive.strip()
+        if directive in ("no-store", "no-cache"):
+            return 0.0
+        if directive.startswith("max-age="):
+            try:
+                return max(0.0, float(int(directive[len("max-age="):])))
+            except ValueError:
+                pass
+
+    expires = response.headers.get("Expires")
+    if expires:
+        try:
+            expires_at = parsedate_to_datetime(expires)
+        except (TypeError, ValueError):
+            # An invalid Expires value means "already expired" (RFC 9111)
+            return 0.0
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (expires_at - datetime.now(timezone.utc)).total_seconds())
+
+    return default
+
+
+def _read_json(response: "requests.Response") -> Any:
+    """Parse a response body as JSON."""
+    # Parse the bytes directly rather than via response.json(), which first
+    # decodes the whole body into a second, str copy
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+
+def get_json(
+    url: str, timeout: float, session: Optional["requests.Session"] = None
+) -> Tuple[Any, float]:
+    """GET and parse a JSON document, revalidating any previous copy.
+
+    If an earlier response carried an ETag or Last-Modified validator, the
+    request is made conditional and a 304 reuses the stored body without
+    downloading or parsing it again.
+
+    Returns:
+        The parsed body and its freshness lifetime in seconds.
+
+    Raises:
+        requests.RequestException: On transport errors or error statuses.
+        ValueError: If the body is not valid JSON.
+    """
+    headers: Dict[str, str] = {}
+    hit, validators = validator_cache.get(url)
+    if hit:
+        etag, last_modified, _ = validators
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    response = (session or get_session()).get(
+        url, timeout=timeout, headers=headers
+    )
+    try:
+        if hit and response.status_code == 304:
+            return validators[2], response_ttl(response)
+        response.raise_for_status()
+        data = _read_json(response)
+    finally:
+        response.close()
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        validator_cache.set(url, (etag, last_modified, data), math.inf)
+    else:
+        validator_cache.invalidate(url)
+    return data, response_ttl(response)
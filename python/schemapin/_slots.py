@@ -0,0 +1,19 @@
+"""``__slots__`` for dataclasses on Python versions without ``slots=True``."""
+
+from typing import Tuple
+
+
+def with_slots(cls: type, slots: Tuple[str, ...]) -> type:
+    """Recreate dataclass ``cls`` with ``__slots__`` and no instance ``__dict__``.
+
+    Equivalent to ``@dataclass(slots=True)``, which needs Python 3.10, but
+    lets the slot list add private attributes (e.g. caches) to the fields.
+    """
+    cls_dict = dict(cls.__dict__)
+    for name in slots:
+        # Class-level field defaults would shadow the slot descriptors
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    cls_dict["__slots__"] = slots
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
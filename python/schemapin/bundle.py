@@ -7,11 +7,28 @@ and safely exchanged between agents over A2A. See
 """
 
 import json
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+from ._slots import with_slots
+from .core import SchemaPinCore
 from .revocation import RevocationDocument
 
+try:
+    import orjson
+except ImportError:  # Optional: install schemapin[fast] for faster bundle parsing
+    orjson = None
+
+
+def _domain_key(domain: Any) -> Any:
+    """Intern string domains used as index keys.
+
+    Callers usually query with literal or already-interned domains, which
+    then match an index key by identity without a character comparison.
+    """
+    return sys.intern(domain) if type(domain) is str else domain
+
 
 @dataclass
 class BundleAuthority:
@@ -48,23 +65,124 @@ class SchemaPinTrustBundle:
     expires_at: Optional[str] = None
     signature: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        # Serialized revocations held back by from_dict, and the documents
+        # already built from them by find_revocation, keyed by raw position
+        self._raw_revocations: Optional[List[Dict[str, Any]]] = None
+        self._rev_cache: Dict[int, RevocationDocument] = {}
+        # The by-domain index is built on first lookup
+        self._indexed: Optional[Tuple[int, int, int, int]] = None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for unset attributes. from_dict leaves ``revocations``
+        # unset and deserializes the whole list on first access.
+        if name != "revocations" or self._raw_revocations is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        cache = self._rev_cache
+        self.revocations = [
+            cache[i] if i in cache else RevocationDocument.from_dict(r)
+            for i, r in enumerate(self._raw_revocations)
+        ]
+        self._raw_revocations = None
+        self._rev_cache = {}
+        self.invalidate_index()
+        return self.revocations
+
+    def _defer_revocations(self, raw: List[Dict[str, Any]]) -> None:
+        """Hold serialized revocations, deserializing each on first lookup."""
+        if raw:
+            del self.revocations
+            self._raw_revocations = list(raw)
+            self._rev_cache = {}
+            self.invalidate_index()
+
+    def _index_key(self) -> Tuple[int, int, int, int]:
+        """Identity and length of the indexed lists, to detect direct edits."""
+        revocations = self._raw_revocations
+        if revocations is None:
+            revocations = self.revocations
+        return (
+            id(self.documents), len(self.documents),
+            id(revocations), len(revocations),
+        )
+
+    def _reindex(self) -> None:
+        """Rebuild the by-domain lookup tables.
+
+        The first entry for a domain wins, matching a front-to-back scan.
+        """
+        doc_by_domain: Dict[Any, Dict[str, Any]] = {}
+        for doc in self.documents:
+            doc_by_domain.setdefault(_domain_key(doc.get("domain")), doc)
+        rev_by_domain: Dict[str, RevocationDocument] = {}
+        raw_rev_index: Dict[Any, int] = {}
+        if self._raw_revocations is None:
+            for rev in self.revocations:
+                rev_by_domain.setdefault(_domain_key(rev.domain), rev)
+        else:
+            for i, raw in enumerate(self._raw_revocations):
+                raw_rev_index.setdefault(_domain_key(raw.get("domain")), i)
+        self._doc_by_domain = doc_by_domain
+        self._rev_by_domain = rev_by_domain
+        self._raw_rev_index = raw_rev_index
+        self._indexed = self._index_key()
+
+    def _ensure_index(self) -> None:
+        """Build the index if it was invalidated or the lists were replaced or resized."""
+        if self._indexed != self._index_key():
+            self._reindex()
+
+    def invalidate_index(self) -> None:
+        """Rebuild the by-domain index on the next lookup.
+
+        Appending to or replacing ``documents``/``revocations`` is detected
+        automatically; call this after replacing an entry in place.
+        """
+        self._indexed = None
+
+    def add_document(self, document: Dict[str, Any]) -> None:
+        """Append a flattened discovery document."""
+        self.documents.append(document)
+        self.invalidate_index()
+
+    def add_revocation(self, revocation: RevocationDocument) -> None:
+        """Append a revocation document."""
+        self.revocations.append(revocation)
+        self.invalidate_index()
+
     def find_discovery(self, domain: str) -> Optional[Dict[str, Any]]:
         """Find a discovery document for a domain.
 
-        Returns the well-known fields (without the 'domain' key) or None.
+        Returns a new dict of the well-known fields (without the 'domain'
+        key) or None. Entries are indexed by their ``domain``; call
+        :meth:`invalidate_index` after changing an entry in place.
         """
-        for doc in self.documents:
-            if doc.get("domain") == domain:
-                result = {k: v for k, v in doc.items() if k != "domain"}
-                return result
-        return None
+        self._ensure_index()
+        doc = self._doc_by_domain.get(domain)
+        if doc is None:
+            return None
+        stripped = dict(doc)
+        stripped.pop("domain", None)
+        return stripped
 
     def find_revocation(self, domain: str) -> Optional[RevocationDocument]:
-        """Find a revocation document for a domain."""
-        for rev in self.revocations:
-            if rev.domain == domain:
-                return rev
-        return None
+        """Find a revocation document for a domain.
+
+        As with find_discovery, documents are indexed by ``domain``.
+        """
+        self._ensure_index()
+        if self._raw_revocations is None:
+            return self._rev_by_domain.get(domain)
+        i = self._raw_rev_index.get(domain)
+        if i is None:
+            return None
+        rev = self._rev_cache.get(i)
+        if rev is None:
+            rev = RevocationDocument.from_dict(self._raw_revocations[i])
+            self._rev_cache[i] = rev
+        return rev
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary with flattened BundledDiscovery format.
@@ -90,28 +208,61 @@ class SchemaPinTrustBundle:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SchemaPinTrustBundle":
-        """Deserialize from dictionary."""
+        """Deserialize from dictionary.
+
+        Revocation documents are deserialized lazily: on lookup for
+        find_revocation, or all at once when ``revocations`` is accessed.
+        """
         ba = data.get("bundle_authority")
-        return cls(
+        bundle = cls(
             schemapin_bundle_version=data["schemapin_bundle_version"],
             created_at=data["created_at"],
             documents=data.get("documents", []),
-            revocations=[
-                RevocationDocument.from_dict(r)
-                for r in data.get("revocations", [])
-            ],
             bundle_authority=BundleAuthority.from_dict(ba) if ba else None,
             signed_at=data.get("signed_at"),
             expires_at=data.get("expires_at"),
             signature=data.get("signature"),
         )
+        bundle._defer_revocations(data.get("revocations", []))
+        return bundle
+
+    def to_json(self) -> str:
+        """Serialize to a compact JSON string with sorted keys.
+
+        The output is the same with or without orjson installed.
+        """
+        # Same format as canonical schemas, so reuse their backend-checked path
+        return SchemaPinCore.canonicalize_schema(self.to_dict())
 
     @classmethod
-    def from_json(cls, json_str: str) -> "SchemaPinTrustBundle":
-        """Deserialize from JSON string."""
+    def from_json(cls, json_str: Union[str, bytes]) -> "SchemaPinTrustBundle":
+        """Deserialize from JSON string or UTF-8 bytes."""
+        if orjson is not None:
+            return cls.from_dict(orjson.loads(json_str))
         return cls.from_dict(json.loads(json_str))
 
 
+SchemaPinTrustBundle = with_slots(  # type: ignore[misc]
+    SchemaPinTrustBundle,
+    (
+        "schemapin_bundle_version",
+        "created_at",
+        "documents",
+        "revocations",
+        "bundle_authority",
+        "signed_at",
+        "expires_at",
+        "signature",
+        "_raw_revocations",
+        "_rev_cache",
+        "_doc_by_domain",
+        "_rev_by_domain",
+        "_raw_rev_index",
+        "_indexed",
+    ),
+)
+
+
 def create_bundled_discovery(
     domain: str, well_known: Dict[str, Any]
 ) -> Dict[str, Any]:
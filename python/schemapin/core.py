@@ -4,6 +4,28 @@ import hashlib
 import json
 from typing import Any, Dict
 
+try:
+    import orjson
+except ImportError:  # Optional: install schemapin[fast] for faster canonicalization
+    orjson = None
+
+# orjson and the json module format floats differently (exponent thresholds
+# and notation) and orjson writes NaN/Infinity as null. Every orjson float
+# token has a digit followed by "." or "e", so with digits folded to "0" any
+# output holding "0.", "0e" or "null" is re-serialized with json, as is any
+# output that does not parse back to the input (values json cannot encode).
+# This keeps canonical bytes, and therefore signatures, independent of the
+# backend.
+_DIGITS_TO_ZERO = bytes.maketrans(b"0123456789", b"0000000000")
+if orjson is not None:
+    # Hand types json handles differently (or rejects) back to json
+    _ORJSON_OPTIONS = (
+        orjson.OPT_SORT_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
 
 class SchemaPinCore:
     """Core SchemaPin operations for schema canonicalization and hashing."""
@@ -19,12 +41,31 @@ class SchemaPinCore:
         3. Sort keys lexicographically (recursive)
         4. Strict JSON serialization
 
+        Uses orjson when installed and its output is byte-identical to the
+        json module's; floats, nulls and types json rejects (e.g. Enum, UUID)
+        always go through json.
+
         Args:
             schema: Tool schema as dictionary
 
         Returns:
             Canonical string representation
         """
+        if orjson is not None:
+            try:
+                canonical = orjson.dumps(schema, option=_ORJSON_OPTIONS)
+            except orjson.JSONEncodeError:
+                # Non-string keys, out-of-range ints, passed-through types, etc.
+                pass
+            else:
+                folded = canonical.translate(_DIGITS_TO_ZERO)
+                if (
+                    b"0." not in folded and b"0e" not in folded and b"null" not in folded
+                    # orjson also writes Enum and UUID values, which json
+                    # rejects; they do not survive the round trip
+                    and orjson.loads(canonical) == schema
+                ):
+                    return canonical.decode('utf-8')
         return json.dumps(schema, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
 
     @staticmethod
@@ -1,6 +1,7 @@
 """Cryptographic operations for SchemaPin using ECDSA P-256."""
 
 import base64
+import functools
 import hashlib
 from typing import Tuple
 
@@ -79,10 +80,14 @@ class KeyManager:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def load_public_key_pem(pem_data: str) -> EllipticCurvePublicKey:
         """
         Load public key from PEM format.
 
+        Parsed keys are immutable, so the most recently loaded PEM strings
+        are cached and the same key object is returned for repeat calls.
+
         Args:
             pem_data: PEM-encoded public key string
 
@@ -110,10 +115,13 @@ class KeyManager:
         return f"sha256:{fingerprint}"
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def calculate_key_fingerprint_from_pem(public_key_pem: str) -> str:
         """
         Calculate SHA-256 fingerprint from PEM-encoded public key.
 
+        Results are cached per PEM string, like ``load_public_key_pem``.
+
         Args:
             public_key_pem: PEM-encoded public key string
 
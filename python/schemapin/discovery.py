@@ -1,13 +1,34 @@
 """Public key discovery via .well-known URIs per RFC 8615."""
 
+import copy
+import functools
 import json
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from urllib.parse import urljoin
 
-import requests
-
+from ._http import NEGATIVE_TTL, get_json, response_cache
 from .crypto import KeyManager
 
+if TYPE_CHECKING:
+    import requests
+
+_WELL_KNOWN_PATH = '/.well-known/schemapin.json'
+# Characters that need real urljoin handling: the start of a path, query or
+# fragment (which the well-known path replaces), or tab/newline (stripped)
+_URLJOIN_CHARS = frozenset('/?#\t\r\n')
+
+
+@functools.lru_cache(maxsize=1024)
+def _well_known_url(domain: str) -> str:
+    """Build the .well-known URI for ``domain``, memoized per domain."""
+    if not domain.startswith(('http://', 'https://')):
+        domain = f"https://{domain}"
+    authority = domain[domain.index('//') + 2:]
+    if _URLJOIN_CHARS.isdisjoint(authority):
+        # Bare host: same result as urljoin without parsing the URL
+        return domain + _WELL_KNOWN_PATH
+    return urljoin(domain, _WELL_KNOWN_PATH)
+
 
 class PublicKeyDiscovery:
     """Handles public key discovery from .well-known endpoints."""
@@ -23,9 +44,7 @@ class PublicKeyDiscovery:
         Returns:
             Full .well-known URI
         """
-        if not domain.startswith(('http://', 'https://')):
-            domain = f"https://{domain}"
-        return urljoin(domain, '/.well-known/schemapin.json')
+        return _well_known_url(domain)
 
     @staticmethod
     def validate_well_known_response(response_data: Dict[str, Any]) -> bool:
@@ -38,33 +57,67 @@ class PublicKeyDiscovery:
         Returns:
             True if response is valid, False otherwise
         """
-        required_fields = ['schema_version', 'public_key_pem']
-        return all(field in response_data for field in required_fields)
+        # Spelled out rather than all(... for field in ...): no generator
+        # per call on the verification path
+        return 'schema_version' in response_data and 'public_key_pem' in response_data
 
     @classmethod
-    def fetch_well_known(cls, domain: str, timeout: int = 10) -> Optional[Dict[str, Any]]:
+    def fetch_well_known(
+        cls,
+        domain: str,
+        timeout: int = 10,
+        session: Optional["requests.Session"] = None,
+        cache: bool = False,
+    ) -> Optional[Dict[str, Any]]:
         """
         Fetch and validate .well-known/schemapin.json from domain.
 
         Args:
             domain: Tool provider domain
             timeout: Request timeout in seconds
+            session: Optional requests session (defaults to the shared pooled one)
+            cache: Serve repeat fetches from the process-wide response cache
 
         Returns:
             Parsed response data if valid, None otherwise
+
+        Every call contacts the server unless ``cache`` is set. A response
+        with an ETag or Last-Modified header is revalidated with a
+        conditional GET either way. With ``cache``, results are kept per URL
+        for the response's Cache-Control max-age (or Expires), five minutes
+        by default, and failures for ten seconds; use :meth:`invalidate` to
+        force a refetch.
         """
+        url = cls.construct_well_known_url(domain)
+        if cache:
+            hit, data = response_cache.get(url)
+            if hit:
+                return copy.deepcopy(data)
+
         try:
-            url = cls.construct_well_known_url(domain)
-            response = requests.get(url, timeout=timeout)
-            response.raise_for_status()
+            data, ttl = get_json(url, timeout, session)
+            if not cls.validate_well_known_response(data):
+                data, ttl = None, NEGATIVE_TTL
 
-            data = response.json()
-            if cls.validate_well_known_response(data):
-                return data
-            return None
+        # requests.RequestException subclasses OSError, so requests itself
+        # need not be imported here
+        except (OSError, json.JSONDecodeError, ValueError):
+            data, ttl = None, NEGATIVE_TTL
 
-        except (requests.RequestException, json.JSONDecodeError, ValueError):
-            return None
+        if cache:
+            response_cache.set(url, data, ttl)
+        # Callers get their own copy so they cannot alter a cached body
+        return copy.deepcopy(data)
+
+    @classmethod
+    def invalidate(cls, domain: str) -> None:
+        """
+        Drop the cached .well-known response for a domain.
+
+        Args:
+            domain: Tool provider domain
+        """
+        response_cache.invalidate(cls.construct_well_known_url(domain))
 
     @classmethod
     def get_public_key_pem(cls, domain: str, timeout: int = 10) -> Optional[str]:
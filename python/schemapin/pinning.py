@@ -2,14 +2,21 @@
 
 import json
 import sqlite3
-from datetime import UTC, datetime
+import threading
+import weakref
 from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from ._clock import utc_iso_now
 from .discovery import PublicKeyDiscovery
 from .interactive import InteractiveHandler, InteractivePinningManager, UserDecision
 
+try:
+    import orjson
+except ImportError:  # Optional: install schemapin[fast] for faster key export/import
+    orjson = None
+
 
 class PinningMode(Enum):
     """Pinning operation modes."""
@@ -26,6 +33,49 @@ class PinningPolicy(Enum):
     INTERACTIVE_ONLY = "interactive_only"
 
 
+# Statements used on every call. sqlite3 keeps compiled statements in a
+# per-connection cache keyed by SQL text, so with the long-lived connection
+# below each of these is parsed and planned once, then only bound and run.
+_SQL_PIN_KEY = '''
+    INSERT INTO pinned_keys
+    (tool_id, public_key_pem, domain, developer_name, pinned_at)
+    VALUES (?, ?, ?, ?, ?)
+'''
+# Bulk import: keep existing pins, or replace them when overwriting
+_SQL_IMPORT_KEEP = _SQL_PIN_KEY.replace('INSERT INTO', 'INSERT OR IGNORE INTO')
+_SQL_IMPORT_OVERWRITE = _SQL_PIN_KEY.replace('INSERT INTO', 'INSERT OR REPLACE INTO')
+_SQL_GET_PINNED_KEY = 'SELECT public_key_pem FROM pinned_keys WHERE tool_id = ?'
+_SQL_UPDATE_LAST_VERIFIED = '''
+    UPDATE pinned_keys
+    SET last_verified = ?
+    WHERE tool_id = ?
+'''
+_SQL_LIST_PINNED_KEYS = '''
+    SELECT tool_id, domain, developer_name, pinned_at, last_verified
+    FROM pinned_keys
+    ORDER BY pinned_at DESC
+'''
+_SQL_EXPORT_PINNED_KEYS = '''
+    SELECT tool_id, domain, developer_name, pinned_at, last_verified,
+           public_key_pem
+    FROM pinned_keys
+    ORDER BY pinned_at DESC
+'''
+_SQL_REMOVE_PINNED_KEY = 'DELETE FROM pinned_keys WHERE tool_id = ?'
+_SQL_GET_KEY_INFO = '''
+    SELECT tool_id, public_key_pem, domain, developer_name,
+           pinned_at, last_verified
+    FROM pinned_keys
+    WHERE tool_id = ?
+'''
+_SQL_SET_DOMAIN_POLICY = '''
+    INSERT OR REPLACE INTO domain_policies
+    (domain, policy, created_at)
+    VALUES (?, ?, ?)
+'''
+_SQL_GET_DOMAIN_POLICY = 'SELECT policy FROM domain_policies WHERE domain = ?'
+
+
 class KeyPinning:
     """Manages key pinning storage using SQLite."""
 
@@ -48,16 +98,46 @@ class KeyPinning:
         self.mode = mode
         self.interactive_manager = InteractivePinningManager(interactive_handler) if mode == PinningMode.INTERACTIVE else None
         self._ensure_db_directory()
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+        # sqlite3 connections sit in a reference cycle, so close ours as soon
+        # as this object goes away rather than whenever the GC gets to it
+        self._close_conn = weakref.finalize(self, self._conn.close)
         self._init_database()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open the long-lived connection shared by all operations."""
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        conn.row_factory = sqlite3.Row
+        # WAL lets readers run alongside a writer; with WAL, synchronous=NORMAL
+        # stays consistent after a crash and only syncs on checkpoints
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-8000')
+        return conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._close_conn()
+
+    def __enter__(self) -> "KeyPinning":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def _ensure_db_directory(self) -> None:
         """Ensure database directory exists."""
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
     def _init_database(self) -> None:
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
+        with self._lock:
+            self._conn.execute('''
                 CREATE TABLE IF NOT EXISTS pinned_keys (
                     tool_id TEXT PRIMARY KEY,
                     public_key_pem TEXT NOT NULL,
@@ -69,14 +149,18 @@ class KeyPinning:
             ''')
 
             # Add domain policies table
-            conn.execute('''
+            self._conn.execute('''
                 CREATE TABLE IF NOT EXISTS domain_policies (
                     domain TEXT PRIMARY KEY,
                     policy TEXT NOT NULL,
                     created_at TEXT NOT NULL
                 )
             ''')
-            conn.commit()
+
+            # Serves the newest-first listing without a sort
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_pinned_pinned_at ON pinned_keys(pinned_at DESC)'
+            )
 
     def pin_key(
         self,
@@ -98,19 +182,14 @@ class KeyPinning:
             True if key was pinned successfully, False if already exists
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute('''
-                    INSERT INTO pinned_keys
-                    (tool_id, public_key_pem, domain, developer_name, pinned_at)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (
+            with self._lock:
+                self._conn.execute(_SQL_PIN_KEY, (
                     tool_id,
                     public_key_pem,
                     domain,
                     developer_name,
-                    datetime.now(UTC).isoformat()
+                    utc_iso_now()
                 ))
-                conn.commit()
                 return True
         except sqlite3.IntegrityError:
             return False
@@ -125,11 +204,8 @@ class KeyPinning:
         Returns:
             PEM-encoded public key if pinned, None otherwise
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                'SELECT public_key_pem FROM pinned_keys WHERE tool_id = ?',
-                (tool_id,)
-            )
+        with self._lock:
+            cursor = self._conn.execute(_SQL_GET_PINNED_KEY, (tool_id,))
             result = cursor.fetchone()
             return result[0] if result else None
 
@@ -155,13 +231,10 @@ class KeyPinning:
         Returns:
             True if updated successfully, False if tool not found
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute('''
-                UPDATE pinned_keys
-                SET last_verified = ?
-                WHERE tool_id = ?
-            ''', (datetime.now(UTC).isoformat(), tool_id))
-            conn.commit()
+        with self._lock:
+            cursor = self._conn.execute(
+                _SQL_UPDATE_LAST_VERIFIED, (utc_iso_now(), tool_id)
+            )
             return cursor.rowcount > 0
 
     def list_pinned_keys(self) -> List[Dict[str, str]]:
@@ -171,13 +244,8 @@ class KeyPinning:
         Returns:
             List of dictionaries containing key information
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute('''
-                SELECT tool_id, domain, developer_name, pinned_at, last_verified
-                FROM pinned_keys
-                ORDER BY pinned_at DESC
-            ''')
+        with self._lock:
+            cursor = self._conn.execute(_SQL_LIST_PINNED_KEYS)
             return [dict(row) for row in cursor.fetchall()]
 
     def remove_pinned_key(self, tool_id: str) -> bool:
@@ -190,12 +258,8 @@ class KeyPinning:
         Returns:
             True if removed successfully, False if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                'DELETE FROM pinned_keys WHERE tool_id = ?',
-                (tool_id,)
-            )
-            conn.commit()
+        with self._lock:
+            cursor = self._conn.execute(_SQL_REMOVE_PINNED_KEY, (tool_id,))
             return cursor.rowcount > 0
 
     def get_key_info(self, tool_id: str) -> Optional[Dict[str, str]]:
@@ -208,14 +272,8 @@ class KeyPinning:
         Returns:
             Dictionary with key information if found, None otherwise
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute('''
-                SELECT tool_id, public_key_pem, domain, developer_name,
-                       pinned_at, last_verified
-                FROM pinned_keys
-                WHERE tool_id = ?
-            ''', (tool_id,))
+        with self._lock:
+            cursor = self._conn.execute(_SQL_GET_KEY_INFO, (tool_id,))
             result = cursor.fetchone()
             return dict(result) if result else None
 
@@ -226,11 +284,12 @@ class KeyPinning:
         Returns:
             JSON string containing all pinned keys
         """
-        keys = self.list_pinned_keys()
-        # Add public key data for export
-        for key_info in keys:
-            key_info['public_key_pem'] = self.get_pinned_key(key_info['tool_id'])
+        with self._lock:
+            cursor = self._conn.execute(_SQL_EXPORT_PINNED_KEYS)
+            keys = [dict(row) for row in cursor.fetchall()]
 
+        if orjson is not None:
+            return orjson.dumps(keys, option=orjson.OPT_INDENT_2).decode("utf-8")
         return json.dumps(keys, indent=2)
 
     def import_pinned_keys(self, json_data: str, overwrite: bool = False) -> int:
@@ -245,25 +304,43 @@ class KeyPinning:
             Number of keys imported
         """
         try:
-            keys = json.loads(json_data)
-            imported = 0
-
-            for key_info in keys:
-                if overwrite and self.is_key_pinned(key_info['tool_id']):
-                    self.remove_pinned_key(key_info['tool_id'])
-
-                if self.pin_key(
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            keys = orjson.loads(json_data) if orjson is not None else json.loads(json_data)
+            # Every key in the batch is pinned at the same moment
+            pinned_at = utc_iso_now()
+            rows = [
+                (
                     key_info['tool_id'],
                     key_info['public_key_pem'],
                     key_info['domain'],
-                    key_info.get('developer_name')
-                ):
-                    imported += 1
-
-            return imported
+                    key_info.get('developer_name'),
+                    pinned_at
+                )
+                for key_info in keys
+            ]
         except (json.JSONDecodeError, KeyError):
             return 0
 
+        # One transaction and a single commit for the whole batch
+        sql = _SQL_IMPORT_OVERWRITE if overwrite else _SQL_IMPORT_KEEP
+        with self._lock, self._conn:
+            self._conn.execute('BEGIN IMMEDIATE')
+            self._conn.execute('SAVEPOINT import_batch')
+            try:
+                return self._conn.executemany(sql, rows).rowcount
+            except sqlite3.IntegrityError:
+                # A row breaking a constraint (e.g. a null public_key_pem)
+                # aborts executemany; redo the batch row by row, skipping
+                # rows that fail, as pin_key does
+                self._conn.execute('ROLLBACK TO import_batch')
+            imported = 0
+            for row in rows:
+                try:
+                    imported += self._conn.execute(sql, row).rowcount
+                except sqlite3.IntegrityError:
+                    continue
+            return imported
+
     def set_domain_policy(self, domain: str, policy: PinningPolicy) -> bool:
         """
         Set pinning policy for a domain.
@@ -276,13 +353,11 @@ class KeyPinning:
             True if policy was set successfully
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute('''
-                    INSERT OR REPLACE INTO domain_policies
-                    (domain, policy, created_at)
-                    VALUES (?, ?, ?)
-                ''', (domain, policy.value, datetime.now(UTC).isoformat()))
-                conn.commit()
+            with self._lock:
+                self._conn.execute(
+                    _SQL_SET_DOMAIN_POLICY,
+                    (domain, policy.value, utc_iso_now())
+                )
                 return True
         except sqlite3.Error:
             return False
@@ -297,11 +372,8 @@ class KeyPinning:
         Returns:
             Pinning policy for domain, defaults to DEFAULT
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                'SELECT policy FROM domain_policies WHERE domain = ?',
-                (domain,)
-            )
+        with self._lock:
+            cursor = self._conn.execute(_SQL_GET_DOMAIN_POLICY, (domain,))
             result = cursor.fetchone()
             if result:
                 try:
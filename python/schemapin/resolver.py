@@ -1,14 +1,39 @@
 """Discovery resolver abstraction for SchemaPin."""
 
+import copy
 import json
+import mmap
 import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
+from ._http import TTLCache
 from .bundle import SchemaPinTrustBundle
 from .discovery import PublicKeyDiscovery
 from .revocation import RevocationDocument, fetch_revocation_document
 
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+except ImportError:  # Optional: install schemapin[fast] for faster local file parsing
+    orjson = None
+
+
+# Local files at least this large are parsed straight from a read-only memory
+# map when orjson is available, instead of being copied into a bytes object
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _parse_json_bytes(data: bytes) -> Any:
+    """Parse UTF-8 JSON file contents."""
+    # Both parsers take bytes, skipping a separate decode to str
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class SchemaResolver(ABC):
     """Abstract base class for discovery resolution."""
@@ -33,16 +58,28 @@ class SchemaResolver(ABC):
 
 
 class WellKnownResolver(SchemaResolver):
-    """Resolves discovery via standard .well-known HTTPS endpoints."""
+    """Resolves discovery via standard .well-known HTTPS endpoints.
 
-    def __init__(self, timeout: int = 10):
+    Pass ``cache=True`` to reuse fetched documents for their HTTP freshness
+    lifetime instead of contacting the server on every resolution.
+    """
+
+    def __init__(
+        self,
+        timeout: int = 10,
+        session: Optional["requests.Session"] = None,
+        cache: bool = False,
+    ):
         self._timeout = timeout
+        self._session = session
+        self._cache = cache
 
     def resolve_discovery(self, domain: str) -> Optional[Dict[str, Any]]:
         """Fetch discovery from .well-known endpoint."""
         try:
             return PublicKeyDiscovery.fetch_well_known(
-                domain, timeout=self._timeout
+                domain, timeout=self._timeout, session=self._session,
+                cache=self._cache,
             )
         except Exception:
             return None
@@ -54,24 +91,51 @@ class WellKnownResolver(SchemaResolver):
         endpoint = discovery.get("revocation_endpoint")
         if not endpoint:
             return None
-        return fetch_revocation_document(endpoint, timeout=self._timeout)
+        return fetch_revocation_document(
+            endpoint, timeout=self._timeout, session=self._session,
+            cache=self._cache,
+        )
 
 
 class LocalFileResolver(SchemaResolver):
-    """Resolves discovery from local JSON files."""
+    """Resolves discovery from local JSON files.
+
+    Parsed files are kept in memory and only re-read once their modification
+    time or size changes. Each call still returns a fresh object.
+    """
 
     def __init__(
         self, discovery_dir: str, revocation_dir: Optional[str] = None
     ):
         self._discovery_dir = discovery_dir
         self._revocation_dir = revocation_dir
+        # path -> (st_mtime_ns, st_size, parsed JSON)
+        self._cache: Dict[str, Tuple[int, int, Any]] = {}
+
+    def _load(self, path: str) -> Any:
+        """Parsed contents of ``path``, reusing the cached parse if unchanged."""
+        st = os.stat(path)
+        cached = self._cache.get(path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        with open(path, "rb") as f:
+            # Stat the file actually read, in case it changed since os.stat
+            st = os.fstat(f.fileno())
+            if orjson is not None and st.st_size >= _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view:
+                        data = orjson.loads(view)
+            else:
+                data = _parse_json_bytes(f.read())
+        # A single dict assignment, so concurrent callers need no lock
+        self._cache[path] = (st.st_mtime_ns, st.st_size, data)
+        return data
 
     def resolve_discovery(self, domain: str) -> Optional[Dict[str, Any]]:
         """Read {domain}.json from the discovery directory."""
         path = os.path.join(self._discovery_dir, f"{domain}.json")
         try:
-            with open(path) as f:
-                return json.load(f)
+            return copy.deepcopy(self._load(path))
         except (OSError, json.JSONDecodeError):
             return None
 
@@ -85,15 +149,17 @@ class LocalFileResolver(SchemaResolver):
             self._revocation_dir, f"{domain}.revocations.json"
         )
         try:
-            with open(path) as f:
-                data = json.load(f)
-                return RevocationDocument.from_dict(data)
+            return RevocationDocument.from_dict(self._load(path))
         except (OSError, json.JSONDecodeError):
             return None
 
 
 class TrustBundleResolver(SchemaResolver):
-    """Resolves discovery from an in-memory trust bundle."""
+    """Resolves discovery from an in-memory trust bundle.
+
+    Lookups go through the bundle's own per-domain indexes, so they are O(1)
+    and still see documents added to the bundle after the resolver is built.
+    """
 
     def __init__(self, bundle: SchemaPinTrustBundle):
         self._bundle = bundle
@@ -116,25 +182,100 @@ class TrustBundleResolver(SchemaResolver):
 
 
 class ChainResolver(SchemaResolver):
-    """Tries multiple resolvers in order, returning the first success."""
+    """Tries multiple resolvers in order, returning the first success.
+
+    With a positive ``cache_ttl``, successful results are remembered per
+    domain (and, for revocations, per revocation endpoint) for that many
+    seconds, so a burst of verifications for one domain
+    only walks the chain once. Caching is off by default. Every call returns
+    its own copy, so callers may modify results freely.
+
+    With ``parallel=True`` all resolvers are queried at once, so a slow
+    network resolver no longer delays the ones after it. The answer is still
+    the one the sequential chain would give: a result is returned as soon as
+    every resolver ahead of it has missed, without waiting for those behind.
+    Lookups still queued are then cancelled; ones already running finish in
+    the background and are discarded. Parallel chains own a thread pool, so
+    call :meth:`close` (or use the chain as a context manager) when done.
+    """
 
-    def __init__(self, resolvers: List[SchemaResolver]):
+    def __init__(
+        self,
+        resolvers: List[SchemaResolver],
+        cache_ttl: float = 0.0,
+        parallel: bool = False,
+    ):
         self._resolvers = resolvers
+        self._cache_ttl = cache_ttl
+        self._discovery_cache = TTLCache(maxsize=1024)
+        self._revocation_cache = TTLCache(maxsize=1024)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if parallel and len(resolvers) > 1:
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(resolvers), thread_name_prefix="schemapin-resolver"
+            )
+
+    def close(self) -> None:
+        """Shut down the thread pool of a parallel chain.
+
+        The chain keeps working afterwards, querying resolvers in order.
+        """
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def __enter__(self) -> "ChainResolver":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _first_result(self, call: Callable[[SchemaResolver], Any]) -> Any:
+        """Return the first non-None ``call(resolver)`` in chain order."""
+        executor = self._executor
+        if executor is None:
+            for resolver in self._resolvers:
+                result = call(resolver)
+                if result is not None:
+                    return result
+            return None
+
+        futures = [executor.submit(call, resolver) for resolver in self._resolvers]
+        try:
+            # Later resolvers keep running while we wait on earlier ones
+            for future in futures:
+                result = future.result()
+                if result is not None:
+                    return result
+            return None
+        finally:
+            # Drop lookups that have not started once the answer is known
+            for future in futures:
+                future.cancel()
 
     def resolve_discovery(self, domain: str) -> Optional[Dict[str, Any]]:
         """Try each resolver in order."""
-        for resolver in self._resolvers:
-            result = resolver.resolve_discovery(domain)
-            if result is not None:
-                return result
-        return None
+        hit, cached = self._discovery_cache.get(domain)
+        if hit:
+            return copy.deepcopy(cached)
+        result = self._first_result(lambda resolver: resolver.resolve_discovery(domain))
+        if result is not None and self._cache_ttl > 0:
+            self._discovery_cache.set(domain, copy.deepcopy(result), self._cache_ttl)
+        return result
 
     def resolve_revocation(
         self, domain: str, discovery: Dict[str, Any]
     ) -> Optional[RevocationDocument]:
         """Try each resolver in order."""
-        for resolver in self._resolvers:
-            result = resolver.resolve_revocation(domain, discovery)
-            if result is not None:
-                return result
-        return None
+        # The revocation endpoint comes from the discovery document, so a
+        # different document must not be answered from the cache
+        key = (domain, discovery.get("revocation_endpoint"))
+        hit, cached = self._revocation_cache.get(key)
+        if hit:
+            return RevocationDocument.from_dict(cached)
+        result = self._first_result(
+            lambda resolver: resolver.resolve_revocation(domain, discovery)
+        )
+        if result is not None and self._cache_ttl > 0:
+            self._revocation_cache.set(key, result.to_dict(), self._cache_ttl)
+        return result
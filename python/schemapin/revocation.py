@@ -1,11 +1,15 @@
 """Standalone revocation documents for SchemaPin v1.2."""
 
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Collection, Dict, Iterable, List, Optional
 
-import requests
+from ._clock import utc_iso_now
+from ._http import NEGATIVE_TTL, get_json, response_cache
+from ._slots import with_slots
+
+if TYPE_CHECKING:
+    import requests
 
 
 class RevocationReason(Enum):
@@ -43,6 +47,12 @@ class RevokedKey:
         )
 
 
+# One instance per revoked fingerprint, so drop the per-instance __dict__
+RevokedKey = with_slots(  # type: ignore[misc]
+    RevokedKey, ("fingerprint", "revoked_at", "reason")
+)
+
+
 @dataclass
 class RevocationDocument:
     """Standalone revocation document."""
@@ -52,6 +62,17 @@ class RevocationDocument:
     updated_at: str
     revoked_keys: List[RevokedKey] = field(default_factory=list)
 
+    def find_revoked_key(self, fingerprint: str) -> Optional[RevokedKey]:
+        """Find the first revoked key entry for a fingerprint.
+
+        Scans ``revoked_keys`` on every call rather than keeping an index,
+        so in-place edits to the list or its entries are always seen.
+        """
+        for key in self.revoked_keys:
+            if key.fingerprint == fingerprint:
+                return key
+        return None
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
         return {
@@ -74,9 +95,20 @@ class RevocationDocument:
         )
 
 
+RevocationDocument = with_slots(  # type: ignore[misc]
+    RevocationDocument,
+    (
+        "schemapin_version",
+        "domain",
+        "updated_at",
+        "revoked_keys",
+    ),
+)
+
+
 def build_revocation_document(domain: str) -> RevocationDocument:
     """Create an empty revocation document for a domain."""
-    now = datetime.now(timezone.utc).isoformat()
+    now = utc_iso_now()
     return RevocationDocument(
         schemapin_version="1.2",
         domain=domain,
@@ -91,33 +123,52 @@ def add_revoked_key(
     reason: RevocationReason,
 ) -> None:
     """Add a revoked key entry to the document."""
-    now = datetime.now(timezone.utc).isoformat()
+    now = utc_iso_now()
     doc.revoked_keys.append(
         RevokedKey(fingerprint=fingerprint, revoked_at=now, reason=reason)
     )
     doc.updated_at = now
 
 
+def add_revoked_keys(
+    doc: RevocationDocument,
+    fingerprints: Iterable[str],
+    reason: RevocationReason,
+) -> None:
+    """Add revoked key entries for many fingerprints sharing one timestamp."""
+    now = utc_iso_now()
+    doc.revoked_keys.extend(
+        RevokedKey(fingerprint=fingerprint, revoked_at=now, reason=reason)
+        for fingerprint in fingerprints
+    )
+    doc.updated_at = now
+
+
 def check_revocation(doc: RevocationDocument, fingerprint: str) -> None:
     """Check if a fingerprint is revoked in the standalone document.
 
     Raises:
         ValueError: If the key is revoked.
     """
-    for key in doc.revoked_keys:
-        if key.fingerprint == fingerprint:
-            raise ValueError(
-                f"Key {fingerprint} is revoked: {key.reason.value}"
-            )
+    key = doc.find_revoked_key(fingerprint)
+    if key is not None:
+        raise ValueError(
+            f"Key {fingerprint} is revoked: {key.reason.value}"
+        )
 
 
 def check_revocation_combined(
-    simple_revoked: Optional[List[str]],
+    simple_revoked: Optional[Collection[str]],
     revocation_doc: Optional[RevocationDocument],
     fingerprint: str,
 ) -> None:
     """Check revocation against both simple list and standalone document.
 
+    ``simple_revoked`` may be any collection of fingerprints. Callers that
+    check many keys against the same list should pass a ``frozenset`` built
+    once when the list is loaded, so each check is a hash lookup rather than
+    a scan.
+
     Raises:
         ValueError: If the key is revoked in either source.
     """
@@ -130,17 +181,38 @@ def check_revocation_combined(
 
 
 def fetch_revocation_document(
-    url: str, timeout: int = 10
+    url: str,
+    timeout: int = 10,
+    session: Optional["requests.Session"] = None,
+    cache: bool = False,
 ) -> Optional[RevocationDocument]:
     """Fetch a standalone revocation document from a URL.
 
+    Uses ``session`` if given, otherwise the shared pooled session. Every
+    call contacts the server, so a newly revoked key is seen immediately,
+    unless ``cache`` opts in to the per-URL cache used by
+    :meth:`PublicKeyDiscovery.fetch_well_known`. Each call still returns a
+    fresh RevocationDocument.
+
     Returns:
         RevocationDocument if successful, None on failure.
     """
+    if cache:
+        hit, data = response_cache.get(url)
+        if hit:
+            return None if data is None else RevocationDocument.from_dict(data)
+
     try:
-        resp = requests.get(url, timeout=timeout)
-        resp.raise_for_status()
-        data = resp.json()
-        return RevocationDocument.from_dict(data)
+        data, ttl = get_json(url, timeout, session)
+        doc = RevocationDocument.from_dict(data)
     except Exception:
-        return None
+        data, doc, ttl = None, None, NEGATIVE_TTL
+
+    if cache:
+        response_cache.set(url, data, ttl)
+    return doc
+
+
+def invalidate_revocation_document(url: str) -> None:
+    """Drop the cached revocation document fetched from ``url``."""
+    response_cache.invalidate(url)
@@ -13,18 +13,21 @@ v1.4 additions (additive, backward-compatible with v1.3 verifiers):
   :func:`SkillSigner.verify_skill_offline_with_dns`.
 """
 
+import codecs
 import hashlib
 import json
 import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, MutableMapping, Optional, Tuple, Union
 
 from .crypto import KeyManager, SignatureManager
 from .dns import DnsTxtRecord, verify_dns_match
-from .resolver import SchemaResolver
+from .resolver import SchemaResolver, WellKnownResolver
 from .revocation import RevocationDocument, check_revocation_combined
 from .verification import (
     ErrorCode,
@@ -39,6 +42,79 @@ SIGNATURE_FILENAME = ".schemapin.sig"
 SCHEMAPIN_VERSION = "1.3"
 # Version written when a v1.4 feature (e.g. expires_at) is present.
 SCHEMAPIN_VERSION_V1_4 = "1.4"
+# Read size for streaming skill files into the hash on Python < 3.11.
+_HASH_CHUNK_SIZE = 1 << 16
+# Skills with more than one file and at least this many bytes in total are
+# hashed on a thread pool. hashlib releases the GIL while hashing large
+# buffers, so files hash in parallel; below this, thread start-up dominates.
+_PARALLEL_HASH_MIN_BYTES = 1 << 20
+# Files changed less than this long before hashing started are not stored in
+# a caller's digest cache (see SkillSigner.canonicalize_skill):
+# a write in the same timestamp tick could leave the stat fields unchanged.
+_DIGEST_SETTLE_NS = 2_000_000_000
+# On Windows st_ctime is the creation time and scandir reports no inode, so
+# edits cannot be detected reliably enough to reuse digests there; a digest
+# cache passed to canonicalize_skill is ignored.
+_CACHE_DIGESTS = os.name != "nt"
+
+# SKILL.md frontmatter and its ``name:`` field
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---", re.DOTALL)
+_NAME_RE = re.compile(r"^name:\s*['\"]?([^'\"#\n]+?)['\"]?\s*$", re.MULTILINE)
+# Bytes of SKILL.md read first; the rest is only read if the frontmatter
+# does not close within them.
+_FRONTMATTER_HEAD_SIZE = 4096
+
+
+def _iter_skill_files(dir_path: str, prefix: str = "") -> Iterator[Tuple[str, os.DirEntry]]:
+    """Yield ``(rel_path, entry)`` for signable files under ``dir_path``.
+
+    Same order and filtering as ``os.walk`` with sorted names: a directory's
+    files first, then its subdirectories depth-first. Symlinks are skipped
+    without being followed, and so is the signature file. File types come
+    from the directory listing, so only the caller's one ``entry.stat()``
+    per file touches the inode. Unreadable directories are skipped, as
+    ``os.walk`` does.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return
+    subdirs = []
+    for entry in entries:
+        if entry.is_symlink():
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry)
+        elif entry.name != SIGNATURE_FILENAME:
+            yield prefix + entry.name, entry
+    for entry in subdirs:
+        yield from _iter_skill_files(entry.path, f"{prefix}{entry.name}/")
+
+
+def _hash_skill_file(rel_str: str, full: Union[str, Path]) -> str:
+    """Return sha256(rel_path_utf8 + file_bytes).hexdigest(), streamed from disk.
+
+    The file is never held in memory whole, and is not concatenated with the
+    path prefix before hashing.
+    """
+    h = hashlib.sha256(rel_str.encode("utf-8"))
+    with open(full, "rb", buffering=0) as f:
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: readinto a reused buffer, GIL released per update
+            hashlib.file_digest(f, lambda: h)
+        else:
+            # Same approach by hand: one buffer, no per-chunk bytes objects.
+            # (Not mmap: a file truncated while mapped raises SIGBUS, and
+            # skill folders being verified are untrusted input.)
+            buf = bytearray(_HASH_CHUNK_SIZE)
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                h.update(view[:n])
+    return h.hexdigest()
 
 
 @dataclass
@@ -77,16 +153,31 @@ class SkillSigner:
     @staticmethod
     def canonicalize_skill(
         skill_dir: Union[str, Path],
+        digest_cache: Optional[
+            MutableMapping[Tuple[str, str], Tuple[Tuple[int, ...], str]]
+        ] = None,
     ) -> Tuple[bytes, Dict[str, str]]:
         """Walk a skill directory deterministically and compute a root hash.
 
         Algorithm:
-          1. os.walk() with sorted dirnames for deterministic order
+          1. Walk the tree (os.scandir) with sorted names for deterministic order
           2. Skip .schemapin.sig and symlinks
           3. Normalize paths to forward slashes
           4. Per-file: sha256(rel_path_utf8 + file_bytes).hexdigest()
+             (files are independent, so large skills hash them concurrently)
           5. Root: sha256(concat of all hexdigests, sorted by rel_path).digest()
 
+        Args:
+            skill_dir: The skill folder.
+            digest_cache: Optional mapping, owned by the caller and passed to
+                repeated calls (e.g. a watcher re-checking a skill), that lets
+                unchanged files skip re-hashing. Entries are keyed by (skill
+                root, rel_path) and hold the file's (st_dev, st_ino, st_size,
+                st_mtime_ns, st_ctime_ns) with its digest; a digest is reused
+                only while all of these match. This trusts filesystem
+                metadata rather than file contents, so signing and
+                verification never pass one.
+
         Returns:
             Tuple of (root_hash_bytes, manifest) where manifest maps
             relative paths to "sha256:<hexdigest>".
@@ -95,36 +186,56 @@ class SkillSigner:
             ValueError: If the directory is empty (no files after filtering).
         """
         skill_path = Path(skill_dir).resolve()
-        manifest: Dict[str, str] = {}
-
-        for dirpath, dirnames, filenames in os.walk(skill_path):
-            dirnames.sort()
-            for fname in sorted(filenames):
-                if fname == SIGNATURE_FILENAME:
-                    continue
-                full = Path(dirpath) / fname
-                if full.is_symlink():
+        root = str(skill_path)
+        if not _CACHE_DIGESTS:
+            digest_cache = None
+        settled_before = time.time_ns() - _DIGEST_SETTLE_NS
+        digests: Dict[str, str] = {}
+        rel_paths: List[str] = []
+        files: List[Tuple[str, str]] = []
+        file_stats: List[Tuple[int, ...]] = []
+        total_size = 0
+
+        # rel_str is joined with forward slashes on every platform
+        for rel_str, entry in _iter_skill_files(root):
+            rel_paths.append(rel_str)
+            st = entry.stat(follow_symlinks=False)
+            file_stat = (
+                st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns
+            )
+            if digest_cache is not None:
+                cached = digest_cache.get((root, rel_str))
+                if cached is not None and cached[0] == file_stat:
+                    digests[rel_str] = cached[1]
                     continue
-                rel = full.relative_to(skill_path)
-                # Normalize to forward slashes
-                rel_str = rel.as_posix()
-                file_bytes = full.read_bytes()
-                digest = hashlib.sha256(
-                    rel_str.encode("utf-8") + file_bytes
-                ).hexdigest()
-                manifest[rel_str] = f"sha256:{digest}"
+            files.append((rel_str, entry.path))
+            file_stats.append(file_stat)
+            total_size += st.st_size
+
+        if len(files) > 1 and total_size >= _PARALLEL_HASH_MIN_BYTES:
+            workers = min(len(files), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                hashed = list(pool.map(lambda item: _hash_skill_file(*item), files))
+        else:
+            hashed = [_hash_skill_file(rel_str, full) for rel_str, full in files]
+        for (rel_str, _full), file_stat, digest in zip(files, file_stats, hashed):
+            digests[rel_str] = digest
+            if digest_cache is not None and max(file_stat[3], file_stat[4]) < settled_before:
+                digest_cache[(root, rel_str)] = (file_stat, digest)
+
+        manifest = {rel_str: f"sha256:{digests[rel_str]}" for rel_str in rel_paths}
 
         if not manifest:
             raise ValueError(
                 f"Skill directory is empty or contains no signable files: {skill_dir}"
             )
 
-        # Root hash: sorted by rel_path, concat hex digests
-        sorted_digests = [
-            manifest[k].split(":", 1)[1] for k in sorted(manifest)
-        ]
+        # Root hash: sorted by rel_path, concat hex digests. Taken from the
+        # bare digests (no "sha256:" prefix to split off); hex is ASCII, and
+        # one join + encode beats a per-file hash update() call.
+        sorted_digests = [digests[k] for k in sorted(digests)]
         root_hash = hashlib.sha256(
-            "".join(sorted_digests).encode("utf-8")
+            "".join(sorted_digests).encode("ascii")
         ).digest()
         return root_hash, manifest
 
@@ -139,17 +250,17 @@ class SkillSigner:
         skill_md = skill_path / "SKILL.md"
         if skill_md.is_file():
             try:
-                text = skill_md.read_text(encoding="utf-8")
-                fm_match = re.search(
-                    r"^---\s*\n(.*?)\n---", text, re.DOTALL
-                )
+                with open(skill_md, "rb") as f:
+                    decoder = codecs.getincrementaldecoder("utf-8")()
+                    # A character split by the head boundary stays buffered
+                    text = decoder.decode(f.read(_FRONTMATTER_HEAD_SIZE))
+                    fm_match = _FRONTMATTER_RE.search(text)
+                    if fm_match is None:
+                        text += decoder.decode(f.read(), final=True)
+                        fm_match = _FRONTMATTER_RE.search(text)
                 if fm_match:
                     frontmatter = fm_match.group(1)
-                    name_match = re.search(
-                        r"^name:\s*['\"]?([^'\"#\n]+?)['\"]?\s*$",
-                        frontmatter,
-                        re.MULTILINE,
-                    )
+                    name_match = _NAME_RE.search(frontmatter)
                     if name_match:
                         return name_match.group(1).strip()
             except OSError:
@@ -338,7 +449,7 @@ class SkillSigner:
         # Step 3: Extract public key and compute fingerprint
         try:
             public_key = KeyManager.load_public_key_pem(public_key_pem)
-            fingerprint = KeyManager.calculate_key_fingerprint(public_key)
+            fingerprint = KeyManager.calculate_key_fingerprint_from_pem(public_key_pem)
         except Exception as e:
             return VerificationResult(
                 valid=False,
@@ -475,8 +586,6 @@ class SkillSigner:
             VerificationResult.
         """
         if resolver is None:
-            from .resolver import WellKnownResolver
-
             resolver = WellKnownResolver()
 
         discovery = resolver.resolve_discovery(domain)
@@ -509,8 +618,14 @@ class SkillSigner:
             Dict with keys "modified", "added", "removed" — each a list of
             relative file paths.
         """
-        current_keys = set(current_manifest)
-        signed_keys = set(signed_manifest)
+        # Unmodified skills are the common case: one C-level dict comparison
+        if current_manifest == signed_manifest:
+            return {"modified": [], "added": [], "removed": []}
+
+        # Compare by key, so values from an untrusted signature need not be
+        # hashable
+        current_keys = current_manifest.keys()
+        signed_keys = signed_manifest.keys()
 
         added = sorted(current_keys - signed_keys)
         removed = sorted(signed_keys - current_keys)
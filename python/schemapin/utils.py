@@ -1,5 +1,6 @@
 """Utility functions for SchemaPin operations."""
 
+import hashlib
 from typing import Any, Dict, List, Optional
 
 from .core import SchemaPinCore
@@ -33,6 +34,20 @@ class SchemaSigningWorkflow:
         schema_hash = SchemaPinCore.canonicalize_and_hash(schema)
         return SignatureManager.sign_schema_hash(schema_hash, self.private_key)
 
+    def sign_canonical_bytes(self, canonical: bytes) -> str:
+        """
+        Sign an already-canonicalized schema and return Base64 signature.
+
+        Args:
+            canonical: UTF-8 bytes of the canonical schema string, as produced
+                by ``SchemaPinCore.canonicalize_schema``
+
+        Returns:
+            Base64-encoded signature
+        """
+        schema_hash = hashlib.sha256(canonical).digest()
+        return SignatureManager.sign_schema_hash(schema_hash, self.private_key)
+
 
 class SchemaVerificationWorkflow:
     """High-level workflow for clients to verify schemas."""
@@ -94,31 +94,35 @@ class VerificationResult:
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
-        d: Dict[str, Any] = {"valid": self.valid}
-        if self.domain is not None:
-            d["domain"] = self.domain
-        if self.developer_name is not None:
-            d["developer_name"] = self.developer_name
+        d: Dict[str, Any] = {
+            "valid": self.valid,
+            **{
+                k: v
+                for k, v in (
+                    ("domain", self.domain),
+                    ("developer_name", self.developer_name),
+                    ("error_code", self.error_code.value if self.error_code is not None else None),
+                    ("error_message", self.error_message),
+                    ("expires_at", self.expires_at),
+                    ("schema_version", self.schema_version),
+                    ("previous_hash", self.previous_hash),
+                )
+                if v is not None
+            },
+        }
         if self.key_pinning is not None:
             d["key_pinning"] = {
-                "status": self.key_pinning.status,
+                k: v
+                for k, v in (
+                    ("status", self.key_pinning.status),
+                    ("first_seen", self.key_pinning.first_seen),
+                )
+                if v is not None
             }
-            if self.key_pinning.first_seen is not None:
-                d["key_pinning"]["first_seen"] = self.key_pinning.first_seen
-        if self.error_code is not None:
-            d["error_code"] = self.error_code.value
-        if self.error_message is not None:
-            d["error_message"] = self.error_message
         if self.warnings:
             d["warnings"] = self.warnings
         if self.expired:
             d["expired"] = True
-        if self.expires_at is not None:
-            d["expires_at"] = self.expires_at
-        if self.schema_version is not None:
-            d["schema_version"] = self.schema_version
-        if self.previous_hash is not None:
-            d["previous_hash"] = self.previous_hash
         return d
 
     def with_expiration_check(
@@ -287,7 +291,7 @@ def verify_schema_offline(
     # Step 2: Extract public key and compute fingerprint
     try:
         public_key = KeyManager.load_public_key_pem(public_key_pem)
-        fingerprint = KeyManager.calculate_key_fingerprint(public_key)
+        fingerprint = KeyManager.calculate_key_fingerprint_from_pem(public_key_pem)
     except Exception as e:
         return VerificationResult(
             valid=False,
@@ -1,7 +1,13 @@
 """Tests for trust bundles."""
 
+import copy
 import json
+import pickle
+import sys
 
+import pytest
+
+from schemapin import core as core_module
 from schemapin.bundle import SchemaPinTrustBundle, create_bundled_discovery
 from schemapin.revocation import (
     RevocationReason,
@@ -50,6 +56,24 @@ class TestTrustBundle:
         # domain key should not be in the returned dict
         assert "domain" not in disc
 
+    def test_find_discovery_returns_plain_dict(self):
+        """Lookups return independent, serializable dicts that track the entry."""
+        bundle = self._make_bundle()
+        disc = bundle.find_discovery("example.com")
+        assert type(disc) is dict
+        json.dumps(disc)
+        copy.deepcopy(disc)
+
+        disc["developer_name"] = "Mallory"
+        assert bundle.find_discovery("example.com")["developer_name"] == "Test Dev"
+
+        bundle.documents[0]["public_key_pem"] = "ROTATED"
+        assert bundle.find_discovery("example.com")["public_key_pem"] == "ROTATED"
+
+        clone = pickle.loads(pickle.dumps(bundle))
+        assert clone == bundle
+        assert clone.find_discovery("example.com") == bundle.find_discovery("example.com")
+
     def test_find_discovery_miss(self):
         """Finding an unknown domain returns None."""
         bundle = self._make_bundle()
@@ -68,6 +92,79 @@ class TestTrustBundle:
         bundle = self._make_bundle()
         assert bundle.find_revocation("unknown.com") is None
 
+    def test_find_first_entry_wins(self):
+        """Duplicate domains resolve to the first entry, as a linear scan would."""
+        bundle = self._make_bundle()
+        bundle.add_document(create_bundled_discovery(
+            "example.com", {"developer_name": "Shadow Dev"}
+        ))
+        bundle.add_revocation(build_revocation_document("example.com"))
+
+        assert bundle.find_discovery("example.com")["developer_name"] == "Test Dev"
+        assert len(bundle.find_revocation("example.com").revoked_keys) == 1
+
+    def test_add_document_and_revocation(self):
+        """Entries added after construction are found."""
+        bundle = self._make_bundle()
+        bundle.add_document(create_bundled_discovery(
+            "other.com", {"developer_name": "Other Dev"}
+        ))
+        bundle.add_revocation(build_revocation_document("other.com"))
+
+        assert bundle.find_discovery("other.com") == {"developer_name": "Other Dev"}
+        assert bundle.find_revocation("other.com").domain == "other.com"
+        assert len(bundle.documents) == 2
+        assert len(bundle.revocations) == 2
+
+    def test_find_after_direct_list_edit(self):
+        """Appending to or replacing the public lists is picked up on lookup."""
+        bundle = self._make_bundle()
+        assert bundle.find_discovery("late.com") is None
+
+        bundle.documents.append(create_bundled_discovery("late.com", {"developer_name": "Late"}))
+        assert bundle.find_discovery("late.com") == {"developer_name": "Late"}
+
+        bundle.revocations = [build_revocation_document("late.com")]
+        assert bundle.find_revocation("example.com") is None
+        assert bundle.find_revocation("late.com").domain == "late.com"
+
+    def test_find_after_in_place_replacement(self):
+        """Replacing an entry without resizing the list is picked up once invalidated."""
+        for bundle in (
+            self._make_bundle(),
+            SchemaPinTrustBundle.from_dict(self._make_bundle().to_dict()),
+        ):
+            assert bundle.find_discovery("example.com") is not None
+            assert bundle.find_revocation("example.com") is not None
+
+            bundle.documents[0] = create_bundled_discovery("b.com", {"developer_name": "B"})
+            bundle.revocations[0] = build_revocation_document("c.com")
+            bundle.invalidate_index()
+
+            assert bundle.find_discovery("b.com") == {"developer_name": "B"}
+            assert bundle.find_discovery("example.com") is None
+            assert bundle.find_revocation("c.com").domain == "c.com"
+            assert bundle.find_revocation("example.com") is None
+
+    def test_lists_are_not_copied(self):
+        """The bundle keeps the caller's lists, so their later edits are seen."""
+        docs = []
+        revs = []
+        bundle = SchemaPinTrustBundle(
+            schemapin_bundle_version="1.2",
+            created_at="2026-01-01T00:00:00+00:00",
+            documents=docs,
+            revocations=revs,
+        )
+        assert bundle.documents is docs
+        assert bundle.revocations is revs
+        assert bundle.to_dict()["documents"] is docs
+
+        docs.append(create_bundled_discovery("late.com", {"developer_name": "Late"}))
+        revs.append(build_revocation_document("late.com"))
+        assert bundle.find_discovery("late.com") == {"developer_name": "Late"}
+        assert bundle.find_revocation("late.com") is revs[0]
+
     def test_serde_roundtrip(self):
         """Serialize and deserialize a bundle."""
         bundle = self._make_bundle()
@@ -81,6 +178,68 @@ class TestTrustBundle:
         assert restored.documents[0]["domain"] == "example.com"
         assert restored.revocations[0].domain == "example.com"
 
+    def test_to_json_roundtrip(self):
+        """to_json output is sorted, compact, and loads back via from_json."""
+        bundle = self._make_bundle()
+        json_str = bundle.to_json()
+        assert json_str == json.dumps(
+            bundle.to_dict(), ensure_ascii=False, separators=(",", ":"), sort_keys=True
+        )
+
+        restored = SchemaPinTrustBundle.from_json(json_str.encode("utf-8"))
+        assert restored.to_dict() == bundle.to_dict()
+
+    def test_to_json_is_backend_independent(self, monkeypatch):
+        """orjson and json give identical output, including for awkward values."""
+        bundle = self._make_bundle()
+        bundle.add_document(create_bundled_discovery("floats.com", {
+            "ratio": 1e16, "small": 1e-7, "nan": float("nan"), "inf": float("inf"),
+            "ints": {1: "one", 2: "two"}, "text": "Zoë",
+        }))
+        with_orjson = bundle.to_json()
+        monkeypatch.setattr(core_module, "orjson", None)
+        assert bundle.to_json() == with_orjson
+
+    def test_from_dict_defers_revocations(self):
+        """Revocations are only deserialized once looked up or listed."""
+        data = self._make_bundle().to_dict()
+        # Malformed entry for another domain: only fails when materialized
+        data["revocations"].append({"domain": "broken.com"})
+        bundle = SchemaPinTrustBundle.from_dict(data)
+
+        rev = bundle.find_revocation("example.com")
+        assert rev is not None
+        assert bundle.find_revocation("example.com") is rev
+        assert bundle.find_revocation("unknown.com") is None
+
+        with pytest.raises(KeyError):
+            _ = bundle.revocations
+
+    def test_lazy_revocations_keep_identity(self):
+        """Listing revocations reuses documents already returned by lookups."""
+        bundle = SchemaPinTrustBundle.from_dict(self._make_bundle().to_dict())
+        rev = bundle.find_revocation("example.com")
+        assert bundle.revocations[0] is rev
+        assert bundle.find_revocation("example.com") is rev
+
+    def test_index_interns_domains(self):
+        """Domains built at runtime are indexed under their interned string."""
+        domain = "".join(["runtime", ".example"])
+        bundle = self._make_bundle()
+        bundle.add_document(create_bundled_discovery(domain, {"developer_name": "Runtime"}))
+        assert bundle.find_discovery("runtime.example") == {"developer_name": "Runtime"}
+        assert any(key is sys.intern(domain) for key in bundle._doc_by_domain)
+
+    def test_slotted_instances(self):
+        """Bundles have no per-instance __dict__ and still copy cleanly."""
+        bundle = SchemaPinTrustBundle.from_dict(self._make_bundle().to_dict())
+        assert not hasattr(bundle, "__dict__")
+        with pytest.raises(AttributeError):
+            bundle.unknown_attribute = True
+        clone = copy.deepcopy(bundle)
+        assert clone == bundle
+        assert clone.find_discovery("example.com") == bundle.find_discovery("example.com")
+
     def test_flattened_format(self):
         """Verify BundledDiscovery uses flattened format."""
         well_known = {
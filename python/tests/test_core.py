@@ -1,8 +1,46 @@
 """Tests for core SchemaPin functionality."""
 
+import ast
+import enum
+import json
+import subprocess
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+import schemapin
+from schemapin import core
 from schemapin.core import SchemaPinCore
 
 
+class _Color(enum.Enum):
+    RED = "red"
+
+
+BACKEND_SCHEMAS = [
+    {"name": "tool", "parameters": {"b": 1, "a": [True, False, -7, 2**63 - 1]}},
+    {"description": "Liefert das Wetter für München 🌦", "n": "\u2028\x00\x7f"},
+    {"default": None, "minimum": 1.5e-05, "maximum": 1e16, "step": 0.1},
+    {"nan": float("nan"), "inf": float("-inf")},
+    {"big": 2**64},
+    {2: "int keys", 10: "sort as strings"},
+    {"text": "version 1.0 released in 2e3"},
+    # Not JSON-native: json raises TypeError, whichever backend is installed
+    {"color": _Color.RED},
+    {"id": uuid.UUID(int=1)},
+]
+
+
+def _canonical_outcome(canonicalize, schema):
+    """Canonical output, or TypeError if the schema cannot be serialized."""
+    try:
+        return canonicalize(schema)
+    except TypeError:
+        return TypeError
+
+
 class TestSchemaPinCore:
     """Test schema canonicalization and hashing."""
 
@@ -89,3 +127,98 @@ class TestSchemaPinCore:
 
         # Should produce identical hashes
         assert hash1 == hash2
+
+
+class TestCanonicalizationBackends:
+    """The optional orjson path must match the json module byte for byte."""
+
+    @pytest.mark.parametrize("schema", BACKEND_SCHEMAS)
+    def test_matches_json_module(self, schema):
+        """Output is identical to the reference json.dumps serialization."""
+        expected = _canonical_outcome(
+            lambda s: json.dumps(s, ensure_ascii=False, separators=(',', ':'), sort_keys=True),
+            schema,
+        )
+        assert _canonical_outcome(SchemaPinCore.canonicalize_schema, schema) == expected
+
+    @pytest.mark.parametrize("schema", BACKEND_SCHEMAS)
+    def test_without_orjson(self, schema, monkeypatch):
+        """The json fallback produces the same canonical form."""
+        expected = _canonical_outcome(SchemaPinCore.canonicalize_schema, schema)
+        monkeypatch.setattr(core, "orjson", None)
+        assert _canonical_outcome(SchemaPinCore.canonicalize_schema, schema) == expected
+
+
+class TestPackageExports:
+    """Test the lazily resolved package namespace."""
+
+    def test_all_names_resolve(self):
+        """Every name in __all__ is reachable from the package."""
+        for name in schemapin.__all__:
+            assert getattr(schemapin, name) is not None
+        assert set(schemapin.__all__) <= set(dir(schemapin))
+
+    def test_type_checking_imports_match_lazy_exports(self):
+        """The TYPE_CHECKING imports name exactly the lazily exported symbols."""
+        tree = ast.parse(Path(schemapin.__file__).read_text(encoding="utf-8"))
+        guard = next(
+            node for node in tree.body
+            if isinstance(node, ast.If) and getattr(node.test, "id", None) == "TYPE_CHECKING"
+        )
+        imported = {
+            (node.module, alias.name, alias.asname or alias.name)
+            for node in guard.body
+            for alias in node.names
+        }
+        assert imported == {
+            (module, attr, name) for name, (module, attr) in schemapin._LAZY.items()
+        }
+
+    def test_aliased_a2a_exports(self):
+        """The a2a helpers keep their prefixed aliases."""
+        from schemapin import a2a
+
+        assert schemapin.a2a_allows is a2a.allows
+        assert schemapin.a2a_intersect is a2a.intersect
+
+    def test_submodules_resolve_as_attributes(self):
+        """Submodules are reachable as attributes without importing them first."""
+        code = (
+            "import schemapin; "
+            "print(schemapin.resolver.__name__, schemapin.bundle.__name__)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.split() == ["schemapin.resolver", "schemapin.bundle"]
+
+    def test_unknown_attribute(self):
+        """Unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = schemapin.does_not_exist
+
+    def test_import_defers_optional_modules(self):
+        """A bare import only loads the core and crypto modules."""
+        code = (
+            "import sys, schemapin; "
+            "print(sorted(m for m in sys.modules if m.startswith('schemapin.')))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.strip() == "['schemapin.core', 'schemapin.crypto']"
+
+    def test_offline_modules_do_not_import_requests(self):
+        """requests is only imported once an HTTP session is needed."""
+        code = (
+            "import sys, schemapin.skill, schemapin.pinning, schemapin.utils; "
+            "from schemapin.resolver import ChainResolver, WellKnownResolver; "
+            "WellKnownResolver(); "
+            "print('requests' in sys.modules); "
+            "from schemapin._http import get_session; get_session(); "
+            "print('requests' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.split() == ["False", "True"]
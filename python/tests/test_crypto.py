@@ -1,6 +1,10 @@
 """Tests for cryptographic operations."""
 
+import pytest
+
+from schemapin.core import SchemaPinCore
 from schemapin.crypto import KeyManager, SignatureManager
+from schemapin.utils import SchemaSigningWorkflow
 
 
 class TestKeyManager:
@@ -50,6 +54,28 @@ class TestKeyManager:
         loaded_key = KeyManager.load_public_key_pem(pem_data)
         assert hasattr(loaded_key, 'public_bytes')
 
+    def test_load_public_key_pem_is_cached(self):
+        """Repeat loads and fingerprints of one PEM reuse the cached result."""
+        _, public_key = KeyManager.generate_keypair()
+        pem_data = KeyManager.export_public_key_pem(public_key)
+
+        loaded_key = KeyManager.load_public_key_pem(pem_data)
+        hits = KeyManager.load_public_key_pem.cache_info().hits
+        assert KeyManager.load_public_key_pem(pem_data) is loaded_key
+        assert KeyManager.load_public_key_pem.cache_info().hits == hits + 1
+
+        fingerprint = KeyManager.calculate_key_fingerprint_from_pem(pem_data)
+        assert fingerprint == KeyManager.calculate_key_fingerprint(public_key)
+        hits = KeyManager.calculate_key_fingerprint_from_pem.cache_info().hits
+        assert KeyManager.calculate_key_fingerprint_from_pem(pem_data) == fingerprint
+        assert KeyManager.calculate_key_fingerprint_from_pem.cache_info().hits == hits + 1
+
+    def test_invalid_public_key_pem_is_not_cached(self):
+        """Parse failures raise on every call rather than being remembered."""
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                KeyManager.load_public_key_pem("not a pem")
+
     def test_key_roundtrip(self):
         """Test key export/import roundtrip."""
         private_key, public_key = KeyManager.generate_keypair()
@@ -155,3 +181,19 @@ class TestSignatureManager:
         public_key = private_key.public_key()
         assert SignatureManager.verify_signature(test_hash, signature1, public_key)
         assert SignatureManager.verify_signature(test_hash, signature2, public_key)
+
+
+class TestSchemaSigningWorkflow:
+    """Test SchemaSigningWorkflow signing entry points."""
+
+    def test_sign_canonical_bytes(self):
+        """Test signing precomputed canonical bytes matches schema signing."""
+        private_key, public_key = KeyManager.generate_keypair()
+        workflow = SchemaSigningWorkflow(KeyManager.export_private_key_pem(private_key))
+        schema = {"name": "tool", "description": "Ünïcode tool", "parameters": {"b": 1, "a": 2}}
+
+        canonical = SchemaPinCore.canonicalize_schema(schema).encode('utf-8')
+        signature_b64 = workflow.sign_canonical_bytes(canonical)
+
+        schema_hash = SchemaPinCore.canonicalize_and_hash(schema)
+        assert SignatureManager.verify_schema_signature(schema_hash, signature_b64, public_key)
@@ -1,10 +1,14 @@
 """Tests for interactive key pinning functionality."""
 
+import json
 import os
+import sqlite3
 import tempfile
+import threading
 import unittest
 from unittest.mock import Mock, patch
 
+from schemapin import pinning as pinning_module
 from schemapin.crypto import KeyManager
 from schemapin.interactive import (
     CallbackInteractiveHandler,
@@ -172,8 +176,11 @@ class TestKeyPinningInteractive(unittest.TestCase):
 
     def tearDown(self):
         """Clean up test fixtures."""
-        if os.path.exists(self.db_path):
-            os.unlink(self.db_path)
+        # A KeyPinning kept alive by a reference cycle (e.g. through a failed
+        # discovery request's traceback) still has its WAL files open
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.db_path + suffix):
+                os.unlink(self.db_path + suffix)
         os.rmdir(self.temp_dir)
 
     def test_automatic_mode_pinning(self):
@@ -372,5 +379,138 @@ class TestKeyPinningInteractive(unittest.TestCase):
         self.assertFalse(pinning.is_key_pinned(self.tool_id))
 
 
+class TestKeyPinningStorage(unittest.TestCase):
+    """Test the SQLite storage behind KeyPinning."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "test_pinning.db")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def test_persistent_connection_uses_wal(self):
+        """The shared connection runs in WAL mode."""
+        with KeyPinning(db_path=self.db_path) as pinning:
+            mode = pinning._conn.execute('PRAGMA journal_mode').fetchone()[0]
+            self.assertEqual(mode, 'wal')
+
+    def test_listing_uses_pinned_at_index(self):
+        """Newest-first listing is served from an index, not a sort."""
+        with KeyPinning(db_path=self.db_path) as pinning:
+            plan = " ".join(
+                row[-1] for row in pinning._conn.execute(
+                    'EXPLAIN QUERY PLAN SELECT tool_id FROM pinned_keys ORDER BY pinned_at DESC'
+                )
+            )
+            self.assertIn("idx_pinned_pinned_at", plan)
+            self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_close(self):
+        """Closing releases the connection; data persists for the next instance."""
+        with KeyPinning(db_path=self.db_path) as pinning:
+            self.assertTrue(pinning.pin_key("tool", "PEM", "example.com"))
+        with self.assertRaises(sqlite3.ProgrammingError):
+            pinning.get_pinned_key("tool")
+
+        with KeyPinning(db_path=self.db_path) as reopened:
+            self.assertEqual(reopened.get_pinned_key("tool"), "PEM")
+
+    def test_export_includes_public_keys(self):
+        """Export returns every pinned key with its PEM and metadata."""
+        with KeyPinning(db_path=self.db_path) as pinning:
+            pinning.pin_key("tool-a", "PEM-A", "a.example.com", "Dev A")
+            pinning.pin_key("tool-b", "PEM-B", "b.example.com")
+            exported = json.loads(pinning.export_pinned_keys())
+
+        self.assertEqual(
+            {k["tool_id"]: k["public_key_pem"] for k in exported},
+            {"tool-a": "PEM-A", "tool-b": "PEM-B"},
+        )
+        self.assertEqual(
+            list(exported[0]),
+            ["tool_id", "domain", "developer_name", "pinned_at", "last_verified",
+             "public_key_pem"],
+        )
+
+    def test_export_import_roundtrip_with_either_backend(self):
+        """Exports from either JSON backend import back into a fresh store."""
+        for backend in (pinning_module.orjson, None):
+            with self.subTest(orjson=backend is not None), \
+                    patch.object(pinning_module, "orjson", backend):
+                with KeyPinning(db_path=self.db_path) as pinning:
+                    pinning.pin_key("tool-ü", "PEM-Ü", "ü.example.com", "Dév")
+                    exported = pinning.export_pinned_keys()
+                    pinning.remove_pinned_key("tool-ü")
+
+                    self.assertEqual(pinning.import_pinned_keys(exported), 1)
+                    self.assertEqual(pinning.get_pinned_key("tool-ü"), "PEM-Ü")
+                    self.assertEqual(pinning.import_pinned_keys("not json"), 0)
+                    pinning.remove_pinned_key("tool-ü")
+
+    def test_import_keeps_or_overwrites_existing_pins(self):
+        """Import skips already-pinned tools unless overwrite is set."""
+        data = json.dumps([
+            {"tool_id": "tool-a", "public_key_pem": "NEW-A", "domain": "a.example.com"},
+            {"tool_id": "tool-b", "public_key_pem": "NEW-B", "domain": "b.example.com"},
+        ])
+        with KeyPinning(db_path=self.db_path) as pinning:
+            pinning.pin_key("tool-a", "OLD-A", "a.example.com")
+
+            self.assertEqual(pinning.import_pinned_keys(data), 1)
+            self.assertEqual(pinning.get_pinned_key("tool-a"), "OLD-A")
+
+            self.assertEqual(pinning.import_pinned_keys(data, overwrite=True), 2)
+            self.assertEqual(pinning.get_pinned_key("tool-a"), "NEW-A")
+            self.assertEqual(len(pinning.list_pinned_keys()), 2)
+            # One batch, one pinned_at
+            self.assertEqual(len({k["pinned_at"] for k in pinning.list_pinned_keys()}), 1)
+
+    def test_import_skips_rows_breaking_constraints(self):
+        """A row the database rejects is skipped and the rest still import."""
+        data = json.dumps([
+            {"tool_id": "tool-a", "public_key_pem": "NEW-A", "domain": "a.example.com"},
+            {"tool_id": "tool-b", "public_key_pem": None, "domain": "b.example.com"},
+            {"tool_id": "tool-c", "public_key_pem": "NEW-C", "domain": "c.example.com"},
+        ])
+        with KeyPinning(db_path=self.db_path) as pinning:
+            pinning.pin_key("tool-b", "OLD-B", "b.example.com")
+            for overwrite in (False, True):
+                with self.subTest(overwrite=overwrite):
+                    self.assertEqual(pinning.import_pinned_keys(data, overwrite=overwrite), 2)
+                    self.assertEqual(pinning.get_pinned_key("tool-a"), "NEW-A")
+                    self.assertEqual(pinning.get_pinned_key("tool-b"), "OLD-B")
+                    self.assertEqual(pinning.get_pinned_key("tool-c"), "NEW-C")
+                    pinning.remove_pinned_key("tool-a")
+                    pinning.remove_pinned_key("tool-c")
+
+    def test_import_is_all_or_nothing(self):
+        """An entry missing a required field imports nothing."""
+        data = json.dumps([
+            {"tool_id": "tool-a", "public_key_pem": "PEM", "domain": "a.example.com"},
+            {"tool_id": "tool-b"},
+        ])
+        with KeyPinning(db_path=self.db_path) as pinning:
+            self.assertEqual(pinning.import_pinned_keys(data), 0)
+            self.assertEqual(pinning.list_pinned_keys(), [])
+
+    def test_concurrent_use(self):
+        """One instance can be shared between threads."""
+        with KeyPinning(db_path=self.db_path) as pinning:
+            threads = [
+                threading.Thread(
+                    target=pinning.pin_key, args=(f"tool-{i}", "PEM", "example.com")
+                )
+                for i in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(len(pinning.list_pinned_keys()), 8)
+
+
 if __name__ == '__main__':
     unittest.main()
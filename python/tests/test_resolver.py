@@ -1,18 +1,30 @@
 """Tests for resolver implementations."""
 
+import io
 import json
 import os
 import tempfile
+import threading
+from urllib.parse import urljoin
 
+import pytest
+import requests
+
+from schemapin import _http
+from schemapin import resolver as resolver_module
 from schemapin.bundle import SchemaPinTrustBundle, create_bundled_discovery
+from schemapin.discovery import PublicKeyDiscovery
 from schemapin.resolver import (
     ChainResolver,
     LocalFileResolver,
+    SchemaResolver,
     TrustBundleResolver,
+    WellKnownResolver,
 )
 from schemapin.revocation import (
     RevocationReason,
     add_revoked_key,
+    add_revoked_keys,
     build_revocation_document,
 )
 
@@ -37,6 +49,45 @@ def _make_bundle():
     )
 
 
+class _FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, data, headers=None, status_code=200):
+        self._data = data
+        self.headers = headers or {}
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        pass
+
+    @property
+    def content(self):
+        return json.dumps(self._data).encode("utf-8")
+
+    def close(self):
+        pass
+
+
+class _FakeSession:
+    """Records requested URLs and serves canned JSON bodies."""
+
+    def __init__(self, bodies, headers=None):
+        self.bodies = bodies
+        self.headers = headers
+        self.requested = []
+        self.request_headers = []
+
+    def get(self, url, timeout=None, headers=None):
+        self.requested.append(url)
+        self.request_headers.append(headers or {})
+        body = self.bodies[url]
+        if isinstance(body, Exception):
+            raise body
+        if isinstance(body, (_FakeResponse, requests.Response)):
+            return body
+        return _FakeResponse(body, self.headers)
+
+
 class TestTrustBundleResolver:
     """Tests for TrustBundleResolver."""
 
@@ -69,6 +120,17 @@ class TestTrustBundleResolver:
         disc = resolver.resolve_discovery("example.com")
         assert disc is not None
 
+    def test_sees_entries_added_to_bundle(self):
+        """The resolver keeps no snapshot: later bundle additions resolve."""
+        bundle = _make_bundle()
+        resolver = TrustBundleResolver(bundle)
+        assert resolver.resolve_discovery("late.com") is None
+
+        bundle.add_document(create_bundled_discovery("late.com", {"developer_name": "Late"}))
+        bundle.add_revocation(build_revocation_document("late.com"))
+        assert resolver.resolve_discovery("late.com") == {"developer_name": "Late"}
+        assert resolver.resolve_revocation("late.com", {}).domain == "late.com"
+
 
 class TestLocalFileResolver:
     """Tests for LocalFileResolver."""
@@ -90,6 +152,49 @@ class TestLocalFileResolver:
             assert disc is not None
             assert disc["developer_name"] == "File Dev"
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_resolve_discovery_parses_utf8(self, use_orjson, monkeypatch):
+        """Files are parsed as UTF-8 by either backend; bad JSON is a miss."""
+        if not use_orjson:
+            monkeypatch.setattr(resolver_module, "orjson", None)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "example.com.json"), "wb") as f:
+                f.write(json.dumps({"developer_name": "Zoë"}, ensure_ascii=False).encode("utf-8"))
+            with open(os.path.join(tmpdir, "broken.com.json"), "wb") as f:
+                f.write(b'{"developer_name": ')
+
+            resolver = LocalFileResolver(tmpdir)
+            assert resolver.resolve_discovery("example.com") == {"developer_name": "Zoë"}
+            assert resolver.resolve_discovery("broken.com") is None
+
+    def test_unchanged_files_are_not_reparsed(self, monkeypatch):
+        """Parses are reused until the file changes; callers get fresh copies."""
+        parses = []
+        parse = resolver_module._parse_json_bytes
+        monkeypatch.setattr(
+            resolver_module, "_parse_json_bytes", lambda data: parses.append(data) or parse(data)
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "example.com.json")
+            with open(path, "w") as f:
+                json.dump({"developer_name": "First"}, f)
+
+            resolver = LocalFileResolver(tmpdir)
+            disc = resolver.resolve_discovery("example.com")
+            disc["developer_name"] = "Mallory"
+            assert resolver.resolve_discovery("example.com") == {"developer_name": "First"}
+            assert len(parses) == 1
+
+            with open(path, "w") as f:
+                json.dump({"developer_name": "Second"}, f)
+            st = os.stat(path)
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            assert resolver.resolve_discovery("example.com") == {"developer_name": "Second"}
+            assert len(parses) == 2
+
+            os.remove(path)
+            assert resolver.resolve_discovery("example.com") is None
+
     def test_resolve_discovery_missing(self):
         """Missing file returns None."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -112,6 +217,39 @@ class TestLocalFileResolver:
             assert revocation is not None
             assert revocation.domain == "example.com"
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_resolve_large_revocation_file(self, use_orjson, monkeypatch):
+        """Files past the memory-map threshold parse the same with either backend."""
+        if not use_orjson:
+            monkeypatch.setattr(resolver_module, "orjson", None)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            rev = build_revocation_document("example.com")
+            add_revoked_keys(
+                rev, (f"sha256:{i:064x}" for i in range(1000)), RevocationReason.SUPERSEDED
+            )
+            path = os.path.join(tmpdir, "example.com.revocations.json")
+            with open(path, "w") as f:
+                json.dump(rev.to_dict(), f)
+            assert os.path.getsize(path) >= resolver_module._MMAP_THRESHOLD
+
+            resolver = LocalFileResolver(".", revocation_dir=tmpdir)
+            assert resolver.resolve_revocation("example.com", {}) == rev
+
+    def test_malformed_revocation_file_raises(self):
+        """A revocation file with an unknown reason is an error, not a miss."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            rev = build_revocation_document("example.com")
+            add_revoked_key(rev, "sha256:bad", RevocationReason.KEY_COMPROMISE)
+            data = rev.to_dict()
+            data["revoked_keys"][0]["reason"] = "not_a_reason"
+            path = os.path.join(tmpdir, "example.com.revocations.json")
+            with open(path, "w") as f:
+                json.dump(data, f)
+
+            resolver = LocalFileResolver(".", revocation_dir=tmpdir)
+            with pytest.raises(ValueError):
+                resolver.resolve_revocation("example.com", {})
+
     def test_resolve_revocation_no_dir(self):
         """No revocation dir returns None."""
         resolver = LocalFileResolver(".")
@@ -202,3 +340,301 @@ class TestChainResolver:
         )
         chain = ChainResolver([TrustBundleResolver(bundle)])
         assert chain.resolve_discovery("missing.com") is None
+
+    def test_results_are_memoized(self):
+        """Repeated lookups for a domain only walk the chain once."""
+        calls = []
+
+        class _CountingResolver(TrustBundleResolver):
+            def resolve_discovery(self, domain):
+                calls.append(("discovery", domain))
+                return super().resolve_discovery(domain)
+
+            def resolve_revocation(self, domain, discovery):
+                calls.append(("revocation", domain))
+                return super().resolve_revocation(domain, discovery)
+
+        chain = ChainResolver([_CountingResolver(_make_bundle())], cache_ttl=60)
+        disc = chain.resolve_discovery("example.com")
+        assert chain.resolve_discovery("example.com") == disc
+        rev = chain.resolve_revocation("example.com", disc)
+        assert chain.resolve_revocation("example.com", disc) == rev
+        assert calls == [("discovery", "example.com"), ("revocation", "example.com")]
+
+        # Misses are not remembered
+        assert chain.resolve_discovery("missing.com") is None
+        assert chain.resolve_discovery("missing.com") is None
+        assert calls.count(("discovery", "missing.com")) == 2
+
+        # Caching is off by default
+        calls.clear()
+        uncached = ChainResolver([_CountingResolver(_make_bundle())])
+        uncached.resolve_discovery("example.com")
+        uncached.resolve_discovery("example.com")
+        assert len(calls) == 2
+
+    def test_cached_results_are_copies(self):
+        """Modifying a returned result does not affect later cache hits."""
+        chain = ChainResolver([TrustBundleResolver(_make_bundle())], cache_ttl=60)
+        disc = chain.resolve_discovery("example.com")
+        disc["public_key_pem"] = "TAMPERED"
+        again = chain.resolve_discovery("example.com")
+        assert again["public_key_pem"] != "TAMPERED"
+        again["developer_name"] = "Mallory"
+        assert chain.resolve_discovery("example.com")["developer_name"] == "Test Dev"
+
+        rev = chain.resolve_revocation("example.com", disc)
+        rev.revoked_keys.clear()
+        assert chain.resolve_revocation("example.com", disc).revoked_keys
+
+    def test_revocations_are_cached_per_endpoint(self):
+        """A discovery document naming another endpoint is not served from the cache."""
+        old_endpoint = "https://example.com/old-revocations.json"
+        new_endpoint = "https://example.com/revocations.json"
+        revoked = build_revocation_document("example.com")
+        add_revoked_key(revoked, "sha256:bad", RevocationReason.KEY_COMPROMISE)
+        session = _FakeSession({
+            old_endpoint: build_revocation_document("example.com").to_dict(),
+            new_endpoint: revoked.to_dict(),
+        })
+        chain = ChainResolver([WellKnownResolver(session=session)], cache_ttl=60)
+
+        assert not chain.resolve_revocation(
+            "example.com", {"revocation_endpoint": old_endpoint}
+        ).revoked_keys
+        assert chain.resolve_revocation(
+            "example.com", {"revocation_endpoint": new_endpoint}
+        ) == revoked
+        assert session.requested == [old_endpoint, new_endpoint]
+
+    def test_parallel_runs_resolvers_concurrently(self):
+        """A slow resolver does not hold up the ones after it."""
+        started = threading.Event()
+
+        class _SlowMiss(SchemaResolver):
+            def resolve_discovery(self, domain):
+                # Only returns once the next resolver is already running
+                assert started.wait(timeout=5)
+                return None
+
+            def resolve_revocation(self, domain, discovery):
+                return None
+
+        class _Fast(TrustBundleResolver):
+            def resolve_discovery(self, domain):
+                started.set()
+                return super().resolve_discovery(domain)
+
+        chain = ChainResolver([_SlowMiss(), _Fast(_make_bundle())], parallel=True)
+        disc = chain.resolve_discovery("example.com")
+        assert disc["developer_name"] == "Test Dev"
+
+    def test_parallel_keeps_chain_priority(self):
+        """An earlier resolver's answer wins even if a later one finishes first."""
+        release = threading.Event()
+        first = SchemaPinTrustBundle(
+            schemapin_bundle_version="1.2",
+            created_at="2026-01-01T00:00:00+00:00",
+            documents=[create_bundled_discovery("example.com", {"developer_name": "First"})],
+        )
+
+        class _Slow(TrustBundleResolver):
+            def resolve_discovery(self, domain):
+                release.wait(timeout=5)
+                return super().resolve_discovery(domain)
+
+        class _Fast(TrustBundleResolver):
+            def resolve_discovery(self, domain):
+                result = super().resolve_discovery(domain)
+                release.set()
+                return result
+
+        chain = ChainResolver([_Slow(first), _Fast(_make_bundle())], parallel=True)
+        assert chain.resolve_discovery("example.com")["developer_name"] == "First"
+        assert chain.resolve_discovery("missing.com") is None
+        rev = chain.resolve_revocation("example.com", {})
+        assert rev is not None and rev.domain == "example.com"
+
+    def test_close_shuts_down_parallel_pool(self):
+        """Closing a parallel chain stops its threads; lookups still work."""
+        with ChainResolver(
+            [TrustBundleResolver(_make_bundle()), TrustBundleResolver(_make_bundle())],
+            parallel=True,
+        ) as chain:
+            assert chain.resolve_discovery("example.com")["developer_name"] == "Test Dev"
+            executor = chain._executor
+        assert chain._executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
+        assert chain.resolve_discovery("example.com")["developer_name"] == "Test Dev"
+        chain.close()
+
+
+WELL_KNOWN_URL = "https://example.com/.well-known/schemapin.json"
+WELL_KNOWN_BODY = {
+    "schema_version": "1.2",
+    "public_key_pem": "PEM",
+    "revoked_keys": ["sha256:old"],
+    "revocation_endpoint": "https://example.com/revocations.json",
+}
+
+
+class TestWellKnownResolver:
+    """Tests for WellKnownResolver."""
+
+    def setup_method(self):
+        _http.response_cache.clear()
+        _http.validator_cache.clear()
+
+    def test_uses_injected_session(self):
+        """Discovery and revocation fetches go through the given session."""
+        rev = build_revocation_document("example.com")
+        session = _FakeSession({
+            WELL_KNOWN_URL: WELL_KNOWN_BODY,
+            "https://example.com/revocations.json": rev.to_dict(),
+        })
+        resolver = WellKnownResolver(session=session)
+
+        disc = resolver.resolve_discovery("example.com")
+        assert disc["public_key_pem"] == "PEM"
+        assert resolver.resolve_revocation("example.com", disc).domain == "example.com"
+        assert session.requested == [
+            WELL_KNOWN_URL,
+            "https://example.com/revocations.json",
+        ]
+
+    def test_lookups_are_not_cached_by_default(self):
+        """Without cache=True every resolution goes back to the server."""
+        endpoint = "https://example.com/revocations.json"
+        session = _FakeSession({
+            WELL_KNOWN_URL: WELL_KNOWN_BODY,
+            endpoint: build_revocation_document("example.com").to_dict(),
+        })
+        resolver = WellKnownResolver(session=session)
+
+        for _ in range(2):
+            disc = resolver.resolve_discovery("example.com")
+            resolver.resolve_revocation("example.com", disc)
+        assert session.requested == [WELL_KNOWN_URL, endpoint] * 2
+
+    def test_repeated_lookups_are_cached(self):
+        """A second resolution is served from the cache as an independent copy."""
+        session = _FakeSession({WELL_KNOWN_URL: WELL_KNOWN_BODY})
+        resolver = WellKnownResolver(session=session, cache=True)
+
+        first = resolver.resolve_discovery("example.com")
+        first["revoked_keys"].append("sha256:tampered")
+        second = resolver.resolve_discovery("example.com")
+
+        assert second == WELL_KNOWN_BODY
+        assert session.requested == [WELL_KNOWN_URL]
+
+        PublicKeyDiscovery.invalidate("example.com")
+        resolver.resolve_discovery("example.com")
+        assert session.requested == [WELL_KNOWN_URL, WELL_KNOWN_URL]
+
+    def test_failures_are_negatively_cached(self):
+        """A failed fetch is not retried while its short TTL is live."""
+        session = _FakeSession({WELL_KNOWN_URL: requests.ConnectionError("down")})
+        resolver = WellKnownResolver(session=session, cache=True)
+
+        assert resolver.resolve_discovery("example.com") is None
+        assert resolver.resolve_discovery("example.com") is None
+        assert session.requested == [WELL_KNOWN_URL]
+
+    def test_no_store_is_not_cached(self):
+        """Cache-Control: no-store responses are fetched every time."""
+        session = _FakeSession(
+            {WELL_KNOWN_URL: WELL_KNOWN_BODY}, headers={"Cache-Control": "no-store"}
+        )
+        resolver = WellKnownResolver(session=session, cache=True)
+
+        resolver.resolve_discovery("example.com")
+        resolver.resolve_discovery("example.com")
+        assert len(session.requested) == 2
+
+    def test_stale_entries_are_revalidated(self):
+        """An expired entry with an ETag is refreshed by a 304 response."""
+        session = _FakeSession(
+            {WELL_KNOWN_URL: WELL_KNOWN_BODY},
+            headers={"ETag": '"v1"', "Cache-Control": "no-cache"},
+        )
+        resolver = WellKnownResolver(session=session)
+        assert resolver.resolve_discovery("example.com") == WELL_KNOWN_BODY
+
+        session.bodies[WELL_KNOWN_URL] = _FakeResponse(None, status_code=304)
+        assert resolver.resolve_discovery("example.com") == WELL_KNOWN_BODY
+        assert session.request_headers == [{}, {"If-None-Match": '"v1"'}]
+
+    def test_response_ttl_headers(self):
+        """max-age wins over Expires; no headers fall back to the default."""
+        assert _http.response_ttl(_FakeResponse(None, {"Cache-Control": "public, max-age=60"})) == 60
+        assert _http.response_ttl(_FakeResponse(None, {"Expires": "garbage"})) == 0
+        assert _http.response_ttl(
+            _FakeResponse(None, {"Expires": "Thu, 01 Jan 1970 00:00:00 GMT"})
+        ) == 0
+        assert _http.response_ttl(_FakeResponse(None)) == _http.DEFAULT_TTL
+
+    @pytest.mark.parametrize("domain", [
+        "example.com",
+        "example.com:8443",
+        "http://example.com",
+        "https://example.com/",
+        "https://example.com/some/path",
+        "example.com?query=1",
+        "example.com#fragment",
+        "exa\tmple.com",
+    ])
+    def test_construct_well_known_url_matches_urljoin(self, domain):
+        """The fast path gives exactly what urljoin would."""
+        base = domain if domain.startswith(("http://", "https://")) else f"https://{domain}"
+        assert PublicKeyDiscovery.construct_well_known_url(domain) == urljoin(
+            base, "/.well-known/schemapin.json"
+        )
+
+    def test_construct_well_known_url_is_memoized(self):
+        """Repeated domains are served from the per-domain URL cache."""
+        from schemapin.discovery import _well_known_url
+
+        PublicKeyDiscovery.construct_well_known_url("memo.example.com")
+        hits = _well_known_url.cache_info().hits
+        assert PublicKeyDiscovery.construct_well_known_url("memo.example.com") == (
+            "https://memo.example.com/.well-known/schemapin.json"
+        )
+        assert _well_known_url.cache_info().hits == hits + 1
+
+    def test_validate_well_known_response(self):
+        """Both schema_version and public_key_pem are required."""
+        assert PublicKeyDiscovery.validate_well_known_response(WELL_KNOWN_BODY)
+        assert not PublicKeyDiscovery.validate_well_known_response({"public_key_pem": "PEM"})
+        assert not PublicKeyDiscovery.validate_well_known_response({"schema_version": "1.2"})
+        assert not PublicKeyDiscovery.validate_well_known_response([])
+
+    def test_shared_session_is_reused(self):
+        """The default pooled session is created once per process."""
+        assert _http.get_session() is _http.get_session()
+
+    def _raw_response(self, body, headers):
+        """A real Response reading its body from an in-memory stream."""
+        response = requests.Response()
+        response.status_code = 200
+        response.headers.update(headers)
+        response.raw = io.BytesIO(body)
+        return response
+
+    def test_small_bodies_are_parsed_from_bytes(self):
+        """Bodies are read and parsed in one go, straight from bytes."""
+        body = json.dumps(WELL_KNOWN_BODY).encode("utf-8")
+        response = self._raw_response(body, {"Content-Length": str(len(body))})
+        session = _FakeSession({WELL_KNOWN_URL: response})
+        assert _http.get_json(WELL_KNOWN_URL, 10, session) == (
+            WELL_KNOWN_BODY, _http.DEFAULT_TTL
+        )
+
+    def test_invalid_bodies_are_rejected(self):
+        """Truncated bodies and trailing garbage both fail to parse."""
+        url = "https://example.com/revocations.json"
+        for body in (b'{"revoked_keys": [', b'{"revoked_keys": []} trailing'):
+            response = self._raw_response(body, {})
+            with pytest.raises(ValueError):
+                _http.get_json(url, 10, _FakeSession({url: response}))
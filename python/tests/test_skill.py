@@ -1,12 +1,16 @@
 """Tests for skill folder signing and verification."""
 
+import hashlib
 import json
+import os
+import time
 from datetime import timedelta
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
 import pytest
 
+from schemapin import skill as skill_module
 from schemapin.crypto import KeyManager, SignatureManager
 from schemapin.revocation import (
     RevocationReason,
@@ -107,6 +111,24 @@ class TestCanonicalization:
         for key in manifest:
             assert "\\" not in key
 
+    def test_symlinks_skipped_and_walk_order(self, tmp_path: Path) -> None:
+        """Symlinked files and dirs are ignored; files precede subdirectories."""
+        skill = _create_skill_dir(
+            tmp_path / "skill",
+            {
+                "z.txt": "Z",
+                "a/inner.txt": "I",
+                "a/b/deep.txt": "D",
+                f"a/{SIGNATURE_FILENAME}": "ignored",
+            },
+        )
+        outside = _create_skill_dir(tmp_path / "outside", {"secret.txt": "S"})
+        (skill / "link.txt").symlink_to(outside / "secret.txt")
+        (skill / "linkdir").symlink_to(outside, target_is_directory=True)
+
+        _hash, manifest = SkillSigner.canonicalize_skill(skill)
+        assert list(manifest) == ["z.txt", "a/inner.txt", "a/b/deep.txt"]
+
     def test_empty_dir_raises(self, tmp_path: Path) -> None:
         """Empty directory raises ValueError."""
         skill = tmp_path / "empty_skill"
@@ -124,6 +146,91 @@ class TestCanonicalization:
         assert "data.bin" in manifest
         assert manifest["data.bin"].startswith("sha256:")
 
+    @pytest.mark.parametrize("file_digest", [True, False])
+    def test_large_files_streamed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, file_digest: bool
+    ) -> None:
+        """Streamed per-file digests equal sha256(rel_path + whole file)."""
+        if not file_digest:
+            monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        skill = tmp_path / "skill"
+        (skill / "sub").mkdir(parents=True)
+        payload = bytes(range(256)) * 1000  # several read chunks
+        (skill / "sub" / "big.bin").write_bytes(payload)
+        (skill / "empty.txt").write_bytes(b"")
+        _hash, manifest = SkillSigner.canonicalize_skill(skill)
+        assert manifest["sub/big.bin"] == (
+            "sha256:" + hashlib.sha256(b"sub/big.bin" + payload).hexdigest()
+        )
+        assert manifest["empty.txt"] == "sha256:" + hashlib.sha256(b"empty.txt").hexdigest()
+
+    def test_parallel_hashing_matches_serial(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Hashing files on the thread pool gives the same manifest and root."""
+        skill = _create_skill_dir(
+            tmp_path / "skill",
+            {f"dir{i % 3}/file{i}.txt": f"content {i}" * 100 for i in range(12)},
+        )
+        serial = SkillSigner.canonicalize_skill(skill)
+        monkeypatch.setattr(skill_module, "_PARALLEL_HASH_MIN_BYTES", 0)
+        assert SkillSigner.canonicalize_skill(skill) == serial
+
+    def test_unchanged_files_reuse_digests(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """With a digest cache, settled unchanged files are not re-hashed."""
+        hashed = []
+        hash_file = skill_module._hash_skill_file
+        monkeypatch.setattr(
+            skill_module,
+            "_hash_skill_file",
+            lambda rel_str, full: hashed.append(rel_str) or hash_file(rel_str, full),
+        )
+        skill = _create_skill_dir(tmp_path / "skill", {"a.txt": "v1", "b.txt": "B"})
+
+        cache = {}
+
+        # Just-written files are too fresh to cache
+        first = SkillSigner.canonicalize_skill(skill, cache)
+        SkillSigner.canonicalize_skill(skill, cache)
+        assert len(hashed) == 4
+        assert cache == {}
+
+        monkeypatch.setattr(skill_module, "_DIGEST_SETTLE_NS", -10**18)
+        hashed.clear()
+        SkillSigner.canonicalize_skill(skill, cache)
+        assert SkillSigner.canonicalize_skill(skill, cache) == first
+        assert hashed == ["a.txt", "b.txt"]
+
+        # Without a cache every file is hashed again
+        hashed.clear()
+        assert SkillSigner.canonicalize_skill(skill) == first
+        assert hashed == ["a.txt", "b.txt"]
+
+        # Same size, original mtime restored: ctime still exposes the edit
+        # (the pause moves past the filesystem's timestamp granularity)
+        time.sleep(0.05)
+        st = (skill / "a.txt").stat()
+        (skill / "a.txt").write_text("v2")
+        os.utime(skill / "a.txt", ns=(st.st_atime_ns, st.st_mtime_ns))
+        hashed.clear()
+        root_hash, manifest = SkillSigner.canonicalize_skill(skill, cache)
+        assert hashed == ["a.txt"]
+        assert root_hash != first[0]
+        assert manifest["a.txt"] == "sha256:" + hashlib.sha256(b"a.txtv2").hexdigest()
+
+    def test_root_hash_is_sorted_digest_concat(self, tmp_path: Path) -> None:
+        """Root hash is sha256 over the hex digests concatenated in rel_path order."""
+        skill = _create_skill_dir(
+            tmp_path / "skill", {"b.txt": "B", "a/z.txt": "Z", "a.txt": "A"}
+        )
+        root_hash, manifest = SkillSigner.canonicalize_skill(skill)
+        expected = hashlib.sha256(
+            "".join(manifest[k][len("sha256:"):] for k in sorted(manifest)).encode()
+        ).digest()
+        assert root_hash == expected
+
     def test_content_affects_hash(self, tmp_path: Path) -> None:
         """Different content produces a different root hash."""
         s1 = _create_skill_dir(tmp_path / "s1", {"a.txt": "v1"})
@@ -228,6 +335,17 @@ class TestParseSkillName:
         )
         assert SkillSigner.parse_skill_name(skill) == "noname-skill"
 
+    def test_long_frontmatter(self, tmp_path: Path) -> None:
+        """Frontmatter running past the first read is parsed in full."""
+        skill = tmp_path / "long-skill"
+        skill.mkdir()
+        # Pad so a multi-byte character straddles the first 4 KiB read
+        padding = "description: " + "x" * 4078 + "é" * 50
+        (skill / "SKILL.md").write_bytes(
+            f"---\n{padding}\nname: late-name\n---\n# Hello".encode()
+        )
+        assert SkillSigner.parse_skill_name(skill) == "late-name"
+
 
 # ---------------------------------------------------------------------------
 # TestSignAndVerify
@@ -506,6 +624,25 @@ class TestDetectTamperedFiles:
         diff = SkillSigner.detect_tampered_files(m, m)
         assert diff == {"modified": [], "added": [], "removed": []}
 
+    def test_equal_copies_fast_path(self) -> None:
+        """Equal but distinct manifests report no changes, with fresh lists."""
+        signed = {"a.txt": "sha256:aaa", "b.txt": "sha256:bbb"}
+        diff = SkillSigner.detect_tampered_files(dict(signed), signed)
+        assert diff == {"modified": [], "added": [], "removed": []}
+        diff["added"].append("x")
+        assert SkillSigner.detect_tampered_files(dict(signed), signed)["added"] == []
+
+    def test_unhashable_signed_values(self) -> None:
+        """A signed manifest with non-string values from an untrusted signature."""
+        signed = {"a.txt": ["sha256:aaa"], "b.txt": {"h": 1}, "gone.txt": []}
+        current = {"a.txt": "sha256:aaa", "b.txt": "sha256:bbb", "new.txt": "sha256:n"}
+        diff = SkillSigner.detect_tampered_files(current, signed)
+        assert diff == {
+            "modified": ["a.txt", "b.txt"],
+            "added": ["new.txt"],
+            "removed": ["gone.txt"],
+        }
+
 
 # ---------------------------------------------------------------------------
 # TestLoadSignature
@@ -1,14 +1,19 @@
 """Tests for standalone revocation documents."""
 
+import copy
 import json
+import pickle
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
+from schemapin import _clock
 from schemapin.revocation import (
     RevocationDocument,
     RevocationReason,
     RevokedKey,
     add_revoked_key,
+    add_revoked_keys,
     build_revocation_document,
     check_revocation,
     check_revocation_combined,
@@ -34,6 +39,41 @@ class TestRevocationDocument:
         assert doc.revoked_keys[0].fingerprint == "sha256:abc123"
         assert doc.revoked_keys[0].reason == RevocationReason.KEY_COMPROMISE
 
+    def test_timestamps_are_utc_iso8601(self, monkeypatch):
+        """Timestamps parse as aware UTC datetimes close to the current time."""
+        doc = build_revocation_document("example.com")
+        add_revoked_key(doc, "sha256:abc123", RevocationReason.KEY_COMPROMISE)
+        revoked_at = datetime.fromisoformat(doc.revoked_keys[0].revoked_at)
+        assert revoked_at.utcoffset() == timedelta(0)
+        assert abs(datetime.now(timezone.utc) - revoked_at) < timedelta(seconds=5)
+
+        # The cached per-second prefix is refreshed when the second changes
+        monkeypatch.setattr(_clock.time, "time_ns", lambda: 86_400_000_000_001_000)
+        assert _clock.utc_iso_now() == "1972-09-27T00:00:00.000001+00:00"
+        monkeypatch.setattr(_clock.time, "time_ns", lambda: 86_400_001_500_000_000)
+        assert _clock.utc_iso_now() == "1972-09-27T00:00:01.500000+00:00"
+
+    def test_slotted_instances(self):
+        """Documents and entries have no per-instance __dict__ and still copy cleanly."""
+        doc = build_revocation_document("example.com")
+        add_revoked_key(doc, "sha256:abc123", RevocationReason.KEY_COMPROMISE)
+        for obj in (doc, doc.revoked_keys[0]):
+            assert not hasattr(obj, "__dict__")
+            with pytest.raises(AttributeError):
+                obj.unknown_attribute = True
+
+        for clone in (copy.deepcopy(doc), pickle.loads(pickle.dumps(doc))):
+            assert clone == doc
+            assert clone.find_revoked_key("sha256:abc123") == doc.revoked_keys[0]
+
+    def test_add_revoked_keys_in_bulk(self):
+        """Bulk-added entries share one timestamp, which becomes updated_at."""
+        doc = build_revocation_document("example.com")
+        add_revoked_keys(doc, (f"sha256:{i:03d}" for i in range(3)), RevocationReason.SUPERSEDED)
+        assert [k.fingerprint for k in doc.revoked_keys] == ["sha256:000", "sha256:001", "sha256:002"]
+        assert {k.revoked_at for k in doc.revoked_keys} == {doc.updated_at}
+        assert doc.find_revoked_key("sha256:002").reason == RevocationReason.SUPERSEDED
+
     def test_add_multiple_revoked_keys(self):
         """Add multiple revoked keys."""
         doc = build_revocation_document("example.com")
@@ -63,6 +103,47 @@ class TestRevocationDocument:
         doc = build_revocation_document("example.com")
         check_revocation(doc, "sha256:anything")
 
+    def test_find_revoked_key_tracks_list_changes(self):
+        """Lookups see keys added after an earlier lookup or a list swap."""
+        doc = build_revocation_document("example.com")
+        add_revoked_key(doc, "sha256:aaa", RevocationReason.KEY_COMPROMISE)
+        assert doc.find_revoked_key("sha256:bbb") is None
+
+        add_revoked_key(doc, "sha256:bbb", RevocationReason.SUPERSEDED)
+        assert doc.find_revoked_key("sha256:bbb").reason == RevocationReason.SUPERSEDED
+
+        doc.revoked_keys = [doc.revoked_keys[1]]
+        assert doc.find_revoked_key("sha256:aaa") is None
+        check_revocation(doc, "sha256:aaa")
+
+    def test_check_revocation_sees_in_place_edits(self):
+        """Replacing or editing an entry without resizing the list is detected."""
+        doc = build_revocation_document("example.com")
+        add_revoked_key(doc, "sha256:aaa", RevocationReason.KEY_COMPROMISE)
+        check_revocation(doc, "sha256:bbb")
+
+        doc.revoked_keys[0] = RevokedKey(
+            fingerprint="sha256:bbb",
+            revoked_at=doc.updated_at,
+            reason=RevocationReason.SUPERSEDED,
+        )
+        with pytest.raises(ValueError, match="superseded"):
+            check_revocation(doc, "sha256:bbb")
+        check_revocation(doc, "sha256:aaa")
+
+        doc.revoked_keys[0].fingerprint = "sha256:ccc"
+        with pytest.raises(ValueError, match="revoked"):
+            check_revocation(doc, "sha256:ccc")
+        check_revocation(doc, "sha256:bbb")
+
+    def test_find_revoked_key_first_entry_wins(self):
+        """Duplicate fingerprints resolve to the first entry, as a scan would."""
+        doc = build_revocation_document("example.com")
+        add_revoked_key(doc, "sha256:aaa", RevocationReason.KEY_COMPROMISE)
+        add_revoked_key(doc, "sha256:aaa", RevocationReason.SUPERSEDED)
+        with pytest.raises(ValueError, match="key_compromise"):
+            check_revocation(doc, "sha256:aaa")
+
     def test_check_revocation_combined_simple_list(self):
         """Combined check catches revocation in simple list."""
         with pytest.raises(ValueError, match="simple revocation list"):
@@ -70,6 +151,13 @@ class TestRevocationDocument:
                 ["sha256:abc123"], None, "sha256:abc123"
             )
 
+    def test_check_revocation_combined_accepts_sets(self):
+        """A precomputed fingerprint set works like the list form."""
+        revoked = frozenset(["sha256:abc123", "sha256:def456"])
+        with pytest.raises(ValueError, match="simple revocation list"):
+            check_revocation_combined(revoked, None, "sha256:def456")
+        check_revocation_combined(revoked, None, "sha256:other")
+
     def test_check_revocation_combined_standalone_doc(self):
         """Combined check catches revocation in standalone doc."""
         doc = build_revocation_document("example.com")
@@ -13,7 +13,9 @@ from schemapin.revocation import (
 )
 from schemapin.verification import (
     ErrorCode,
+    KeyPinningStatus,
     KeyPinStore,
+    VerificationResult,
     verify_schema_offline,
     verify_schema_with_resolver,
 )
@@ -277,6 +279,27 @@ class TestVerifySchemaOffline:
         assert d["developer_name"] == "Test Dev"
         assert d["key_pinning"]["status"] == "first_use"
 
+    def test_result_to_dict_omits_unset_fields(self):
+        """Only set fields are serialized."""
+        result = VerificationResult(
+            valid=False,
+            domain="example.com",
+            key_pinning=KeyPinningStatus(status="pinned", first_seen="2026-01-01"),
+            error_code=ErrorCode.SIGNATURE_INVALID,
+            warnings=["signature_expired"],
+            expired=True,
+        )
+        d = result.to_dict()
+        assert sorted(d) == [
+            "domain", "error_code", "expired", "key_pinning", "valid", "warnings"
+        ]
+        assert d["key_pinning"] == {"status": "pinned", "first_seen": "2026-01-01"}
+        assert d["error_code"] == ErrorCode.SIGNATURE_INVALID.value
+        assert VerificationResult(valid=True).to_dict() == {"valid": True}
+        assert VerificationResult(
+            valid=True, key_pinning=KeyPinningStatus(status="first_use")
+        ).to_dict() == {"valid": True, "key_pinning": {"status": "first_use"}}
+
 
 class TestVerifySchemaWithResolver:
     """Tests for verify_schema_with_resolver."""